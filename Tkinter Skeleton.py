@@ -3,43 +3,14 @@ from tkinter import ttk, messagebox
 import subprocess
 import sys
 import pathlib
-import sqlite3
 
 # Import modules but don't run their main code automatically
 # We'll use function calls instead of directly importing the modules
 import importlib.util
 
-import os
-
-if os.path.exists("employees.db"):
-    os.remove("employees.db")
-
-# Recreate the database with correct schema
-conn = sqlite3.connect("employees.db")
-cursor = conn.cursor()
-cursor.execute("""
-    CREATE TABLE IF NOT EXISTS employees (
-        id INTEGER PRIMARY KEY,
-        name TEXT NOT NULL,
-        grade TEXT,
-        salary REAL
-    )
-""")
-conn.commit()
-conn.close()
-
-def update_employees_db_from_csv(df):
-    conn = sqlite3.connect("employees.db")
-    cursor = conn.cursor()
-
-    for _, row in df.iterrows():
-        cursor.execute("""
-            INSERT OR REPLACE INTO employees (id, name, grade, salary)
-            VALUES (?, ?, ?, ?)
-        """, (row["ID"], row["Name"], row["Grade"], row["Salary"]))
-
-    conn.commit()
-    conn.close()
+from database import query
+from grade_bands import bands
+from migrations import migrate_database
 
 def import_module(module_name):
     """Import a module by name without running its main code"""
@@ -84,27 +55,6 @@ def ensure_pandas_installed():
 ensure_pandas_installed()
 import pandas as pd
 
-def ensure_employees_table_has_columns():
-    try:
-        conn = sqlite3.connect("employees.db")
-        cursor = conn.cursor()
-
-        cursor.execute("PRAGMA table_info(employees)")
-        columns = [col[1] for col in cursor.fetchall()]
-
-        if "salary" not in columns:
-            cursor.execute("ALTER TABLE employees ADD COLUMN salary REAL")
-            print("Added 'salary' column to employees table.")
-
-        if "grade" not in columns:
-            cursor.execute("ALTER TABLE employees ADD COLUMN grade TEXT")
-            print("Added 'grade' column to employees table.")
-
-        conn.commit()
-        conn.close()
-    except Exception as e:
-        print("Error updating table schema:", e)
-
 class HRPerformanceEvaluatorApp:
     def __init__(self, root):
         print("Initializing main window only")  # Debug to confirm startup
@@ -186,26 +136,14 @@ class HRPerformanceEvaluatorApp:
     def salary_projection():
         GROWTH_RATE = 0.02
         YEARS = 6
-        GRADES_MAX = {
-            "112A": 43700,
-            "113A": 48000,
-            "114A": 52500,
-            "115A": 57600,
-            "116A": 63700,
-            "117A": 69700,
-        }
-
         def get_maximum(grade):
-            return GRADES_MAX.get(grade, float("inf"))
+            return bands.maximum(grade, float("inf"))
 
         salary_projection_employees = []
         salary_projection_total = [0.0 for _ in range(YEARS)]
 
         try:
-            conn = sqlite3.connect("employees.db")
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, name, grade, salary FROM employees")
-            rows = cursor.fetchall()
+            rows = query("SELECT id, name, grade, current_salary FROM employees")
             print(f"Rows fetched: {rows}")  # <--- Add this line
         except Exception as e:
             print("DB Error:", e)
@@ -238,7 +176,6 @@ class HRPerformanceEvaluatorApp:
             projection.extend(yearly)
             salary_projection_employees.append(projection)
 
-        conn.close()
         return salary_projection_employees, salary_projection_total
 
     def open_add_edit_employee(self):
@@ -253,83 +190,7 @@ class HRPerformanceEvaluatorApp:
         if performance_evaluation:
             # Create database first
             performance_evaluation.create_database()
-
-            # Create window
-            window = tk.Toplevel(self.root)
-            window.title("Employee Performance Database")
-            window.geometry("1200x600")
-            window.minsize(600, 500)
-            window.configure(bg="#f0f4f8")
-
-            # Input fields
-            tk.Label(window, text="Name", bg="#f0f4f8").grid(row=0, column=0, padx=5, pady=5)
-            tk.Label(window, text="Grade", bg="#f0f4f8").grid(row=1, column=0, padx=5, pady=5)
-            tk.Label(window, text="Current Salary", bg="#f0f4f8").grid(row=2, column=0, padx=5, pady=5)
-            tk.Label(window, text="Scores (Y1-Y5)", bg="#f0f4f8").grid(row=3, column=0, padx=5, pady=5)
-
-            name_entry = tk.Entry(window)
-            grade_entry = tk.Entry(window)
-            salary_entry = tk.Entry(window)
-            score_entries = [tk.Entry(window, width=4) for _ in range(5)]
-
-            name_entry.grid(row=0, column=1, padx=5, pady=5)
-            grade_entry.grid(row=1, column=1, padx=5, pady=5)
-            salary_entry.grid(row=2, column=1, padx=5, pady=5)
-            for i, entry in enumerate(score_entries):
-                entry.grid(row=3, column=i + 1, padx=2)
-
-            # Set module variables so functions can access them
-            performance_evaluation.name_entry = name_entry
-            performance_evaluation.grade_entry = grade_entry
-            performance_evaluation.salary_entry = salary_entry
-            performance_evaluation.score_entries = score_entries
-            performance_evaluation.root = window
-
-            # Buttons - use lambda to pass the new instances to functions
-            ttk.Button(window, text="Add Employee",
-                       command=performance_evaluation.submit_form).grid(row=4, column=0, pady=5)
-            ttk.Button(window, text="Show Salary Projections",
-                       command=performance_evaluation.show_evaluations).grid(row=4, column=1, pady=5)
-            ttk.Button(window, text="Show Combined Budget",
-                       command=performance_evaluation.show_salary_budget).grid(row=4, column=2, pady=5)
-            ttk.Button(window, text="Delete Selected",
-                       command=performance_evaluation.delete_selected_employee).grid(row=4, column=3, pady=5)
-            ttk.Button(window, text="Import CSV",
-                       command=performance_evaluation.import_from_csv).grid(row=4, column=5, pady=5)
-            ttk.Button(window, text="Export CSV",
-                       command=performance_evaluation.export_to_csv).grid(row=4, column=6, pady=5)
-
-            # Search
-            tk.Label(window, text="Search Name:", bg="#f0f4f8").grid(row=4, column=7, padx=5)
-            search_entry = tk.Entry(window)
-            search_entry.grid(row=4, column=8, padx=5)
-            ttk.Button(window, text="Search",
-                       command=lambda: performance_evaluation.search_employees(search_entry.get())).grid(row=4,
-                                                                                                         column=9,
-                                                                                                         padx=5)
-
-            # Treeview
-            cols = ("ID", "Name", "Grade", "Salary", "Y1", "Y2", "Y3", "Y4", "Y5", "Max Band", "Exceeded Year", "Flag")
-            tree_frame = tk.Frame(window, bg="#f0f4f8")
-            tree_frame.grid(row=7, column=0, columnspan=10, pady=10)
-
-            x_scroll = tk.Scrollbar(tree_frame, orient=tk.HORIZONTAL)
-            x_scroll.pack(side=tk.BOTTOM, fill=tk.X)
-
-            tree = ttk.Treeview(tree_frame, columns=cols, show='headings', xscrollcommand=x_scroll.set)
-            x_scroll.config(command=tree.xview)
-
-            for col in cols:
-                tree.heading(col, text=col)
-                tree.column(col, width=100, anchor='center')
-
-            tree.pack(fill='both', expand=True)
-
-            # Set tree in the module
-            performance_evaluation.tree = tree
-
-            # Call display_records to show data
-            performance_evaluation.display_records()
+            performance_evaluation.show_performance_evaluation(self.root)
 
     def open_salary_forecast(self):
         print("Opening salary forecast")  # Debug
@@ -410,19 +271,9 @@ class HRPerformanceEvaluatorApp:
             tree.heading(col, text=header)
             tree.column(col, width=120, anchor=tk.CENTER)
 
-        # Load static band data
-        grades_data = [
-            {"Grade": "112A", "Minimum": 32240, "Midpoint": 34600, "Maximum": 43700},
-            {"Grade": "113A", "Minimum": 32240, "Midpoint": 38000, "Maximum": 48000},
-            {"Grade": "114A", "Minimum": 32800, "Midpoint": 41900, "Maximum": 52500},
-            {"Grade": "115A", "Minimum": 34400, "Midpoint": 45900, "Maximum": 57600},
-            {"Grade": "116A", "Minimum": 38000, "Midpoint": 50600, "Maximum": 63700},
-            {"Grade": "117A", "Minimum": 41600, "Midpoint": 55500, "Maximum": 69700},
-        ]
-
-        for row in grades_data:
-            tree.insert("", "end", values=(
-            row["Grade"], f"${row['Minimum']:,.0f}", f"${row['Midpoint']:,.0f}", f"${row['Maximum']:,.0f}"))
+        # Band data from the shared grade_bands table
+        for grade, minimum, midpoint, maximum in bands.rows():
+            tree.insert("", "end", values=(grade, f"${minimum:,.0f}", f"${midpoint:,.0f}", f"${maximum:,.0f}"))
 
         # Footnote
         tk.Label(
@@ -436,21 +287,9 @@ class HRPerformanceEvaluatorApp:
     def open_generate_report(self):
         print("Opening Generate Report")
 
-        grade_bands = {
-            "112A": 43700,
-            "113A": 48000,
-            "114A": 52500,
-            "115A": 57600,
-            "116A": 63700,
-            "117A": 69700,
-        }
         forecasted_scores_dict = {}
 
-        conn = sqlite3.connect("employees.db")
-        cur = conn.cursor()
-        cur.execute("SELECT id, name, grade, salary FROM employees;")
-        records = cur.fetchall()
-        conn.close()
+        records = query("SELECT id, name, grade, current_salary FROM employees;")
 
         window = tk.Toplevel(self.root)
         window.title("Salary Forecast Report")
@@ -505,7 +344,7 @@ class HRPerformanceEvaluatorApp:
                 forecasted_score = forecasted_scores_dict.get(emp_id, 3)
                 forecasted_salary = current_salary * (1 + 0.02) ** year_index
                 last_year_salary = current_salary * (1 + 0.02) ** (year_index - 1) if year_index > 1 else current_salary
-                max_salary = grade_bands.get(grade, 0)
+                max_salary = bands.maximum(grade, 0)
                 exceeds = "Yes" if forecasted_salary > max_salary else "No"
 
                 tree_info.insert("", "end", values=(emp_id, name, grade, f"${current_salary:,.2f}"))
@@ -595,9 +434,7 @@ class HRPerformanceEvaluatorApp:
 
 if __name__ == "__main__":
     root = tk.Tk()
-    ensure_employees_table_has_columns()
-    df = pd.read_csv("employee_export.csv")
-    update_employees_db_from_csv(df)
+    migrate_database()  # Upgrades the shared database in place; existing rows are kept
     app = HRPerformanceEvaluatorApp(root)
     root.mainloop()
 
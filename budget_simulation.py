@@ -0,0 +1,181 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from projection_engine import YEARS, round_cents, score_increase
+
+DEFAULT_TRIALS = 20_000
+TRIALS_PER_TASK = 1_000       # Trials handed to a worker process at a time
+MAX_BLOCK_SIZE = 2_000_000    # trials × employees simulated in one vectorized step
+PERCENTILES = (50, 90, 99)
+SMOOTHING = 1.0               # Pseudo-count added to every score when fitting
+
+
+# ------------------------------------------------------------------
+# Score distributions
+# ------------------------------------------------------------------
+def fit_score_distribution(store, smoothing=SMOOTHING):
+    """
+    Probability of each score per grade, fitted from the Y1–Y5 history in an
+    EmployeeStore. Grades without any history use the distribution of all
+    employees.
+
+    Returns:
+        np.ndarray: (grades, scores) rows summing to 1, rows in
+        ``store.grade_labels`` order and columns in ascending score order.
+    """
+    scores = sorted(score_increase)
+    grade_count = len(store.grade_labels)
+    counts = np.zeros((grade_count, len(scores)))
+    for column, score in enumerate(scores):
+        per_employee = (store.scores == score).sum(axis=1)
+        counts[:, column] = np.bincount(store.grade_codes, weights=per_employee, minlength=grade_count)
+
+    overall = counts.sum(axis=0) + smoothing
+    if not overall.sum():
+        overall = np.ones(len(scores))
+    empty = counts.sum(axis=1) == 0
+    counts[empty] = overall
+    counts[~empty] += smoothing
+    return counts / counts.sum(axis=1, keepdims=True)
+
+
+def score_distribution(store, weights=None):
+    """
+    Score probabilities per grade: fitted from history, overridden by weights.
+
+    Args:
+        weights: Optional ``{score: weight}`` used for every grade, or
+            ``{grade: {score: weight}}`` for specific grades (others stay fitted).
+    """
+    probabilities = fit_score_distribution(store)
+    if not weights:
+        return probabilities
+
+    scores = sorted(score_increase)
+    if all(isinstance(key, str) for key in weights):
+        per_grade = weights
+    else:
+        per_grade = {grade: weights for grade in store.grade_labels}
+    for code, grade in enumerate(store.grade_labels):
+        if grade in per_grade:
+            row = np.array([per_grade[grade].get(score, 0) for score in scores], dtype=float)
+            if row.sum() <= 0:
+                raise ValueError(f"Score weights for grade {grade} must add up to more than zero.")
+            probabilities[code] = row / row.sum()
+    return probabilities
+
+
+# ------------------------------------------------------------------
+# Simulation
+# ------------------------------------------------------------------
+def _simulate_trials(salaries, max_salaries, cumulative, rates, trials, seed):
+    """
+    Simulate ``trials`` five-year trajectories for every employee (runs in a
+    worker process).
+
+    Args:
+        cumulative: (employees, scores) cumulative score probabilities.
+        rates: Raise for each score in ascending order, taken from the
+            parent's score_increase (a worker's copy of it may be stale).
+
+    Returns:
+        tuple: ((trials, YEARS) budget totals, per-employee count of trials
+        in which the salary went above the band maximum)
+    """
+    rng = np.random.default_rng(seed)
+    # Growth factor of the lowest score, plus the step up to each next score
+    # for the draws that pass that score's cumulative probability
+    base = 1 + rates[0]
+    steps = np.diff(rates)
+    thresholds = np.ascontiguousarray(cumulative[:, :-1].T)
+    count = len(salaries)
+
+    totals = np.empty((trials, YEARS))
+    exceed_counts = np.zeros(count, dtype=np.int64)
+    block = max(1, MAX_BLOCK_SIZE // max(count, 1))
+    for start in range(0, trials, block):
+        size = min(block, trials - start)
+        salary = np.broadcast_to(salaries, (size, count))
+        exceeded = np.zeros((size, count), dtype=bool)
+        for year in range(YEARS):
+            draws = rng.random((size, count))
+            growth = np.full((size, count), base)
+            for step, threshold in zip(steps, thresholds):
+                growth += (draws > threshold) * step
+            salary = round_cents(salary * growth)
+            totals[start:start + size, year] = salary.sum(axis=1)
+            exceeded |= salary > max_salaries
+        exceed_counts += exceeded.sum(axis=0)
+    return totals, exceed_counts
+
+
+def _pool_context():
+    # Tk runs threads in the parent, so never fork it directly
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def simulate_budget(store, trials=DEFAULT_TRIALS, weights=None, seed=None, processes=None, progress=None):
+    """
+    Monte Carlo salary budget: sample every employee's yearly score from
+    their grade's score distribution, compound salaries for five years
+    (rounded to cents each year like the deterministic projections) and
+    summarise the yearly totals across trials.
+
+    Trials are split into batches of TRIALS_PER_TASK that run in a
+    ProcessPoolExecutor. Each batch gets its own child seed, so a given seed
+    always reproduces the same result whatever the number of processes.
+
+    Args:
+        store: EmployeeStore with the employees to simulate.
+        weights: Score weights, see score_distribution.
+        processes: Worker processes (default: one per CPU; 1 runs inline).
+        progress: Optional callable(batches_done, batches_total).
+
+    Returns:
+        tuple: ({percentile: [budget for years 1–5]} for PERCENTILES, array
+        with each employee's probability of exceeding their band maximum)
+    """
+    if trials < 1:
+        raise ValueError("The number of trials must be at least 1.")
+    if processes is not None and processes < 1:
+        raise ValueError("The number of processes must be at least 1.")
+    if not len(store):
+        return {p: [0.0] * YEARS for p in PERCENTILES}, np.zeros(0)
+
+    cumulative = np.cumsum(score_distribution(store, weights), axis=1)[store.grade_codes]
+    rates = np.array([score_increase[score] for score in sorted(score_increase)])
+    arguments = (store.salaries, store.max_salaries(), cumulative, rates)
+    batches = [min(TRIALS_PER_TASK, trials - start) for start in range(0, trials, TRIALS_PER_TASK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    processes = min(processes or os.cpu_count() or 1, len(batches))
+
+    totals = []
+    exceed_counts = np.zeros(len(store), dtype=np.int64)
+    if processes == 1:
+        results = (_simulate_trials(*arguments, size, child) for size, child in zip(batches, seeds))
+        for done, (batch_totals, batch_counts) in enumerate(results, 1):
+            totals.append(batch_totals)
+            exceed_counts += batch_counts
+            if progress:
+                progress(done, len(batches))
+    else:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=_pool_context()) as pool:
+            futures = [pool.submit(_simulate_trials, *arguments, size, child) for size, child in zip(batches, seeds)]
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    batch_totals, batch_counts = future.result()
+                    totals.append(batch_totals)
+                    exceed_counts += batch_counts
+                    if progress:
+                        progress(done, len(batches))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    budget = np.percentile(np.concatenate(totals), PERCENTILES, axis=0)
+    return dict(zip(PERCENTILES, budget.tolist())), exceed_counts / trials
@@ -0,0 +1,298 @@
+import atexit
+import pathlib
+import sqlite3
+import string
+import threading
+from contextlib import contextmanager
+
+# Shared database file used by every HR window
+DATABASE_FILE = pathlib.Path("employee_performance.db")
+
+BUSY_TIMEOUT_MS = 5000       # Wait this long for another writer before "database is locked"
+STATEMENT_CACHE_SIZE = 256   # Prepared statements kept per connection
+
+_local = threading.local()
+_connections = []
+_connections_lock = threading.Lock()
+
+
+def _open_connection():
+    conn = sqlite3.connect(
+        DATABASE_FILE,
+        timeout=BUSY_TIMEOUT_MS / 1000,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        check_same_thread=False,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    # SQLite's ROUND settles half-cent ties differently; SQL that must agree
+    # with the Python projections rounds through this instead
+    conn.create_function("py_round", 2, round, deterministic=True)
+    return conn
+
+
+def get_connection():
+    """
+    Return the calling thread's connection, opening it on first use.
+
+    Each thread (the Tk thread and any worker threads) keeps one long-lived
+    connection, so the pool never holds more connections than there are threads.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _open_connection()
+        _local.conn = conn
+        with _connections_lock:
+            _connections.append(conn)
+    return conn
+
+
+@contextmanager
+def transaction():
+    """Run the enclosed statements in one transaction, rolling back on error."""
+    conn = get_connection()
+    with conn:
+        yield conn
+
+
+def query(sql, params=()):
+    """Fetch all rows for a read-only statement."""
+    return get_connection().execute(sql, params).fetchall()
+
+
+def query_one(sql, params=()):
+    """Fetch the first row for a read-only statement, or None."""
+    return get_connection().execute(sql, params).fetchone()
+
+
+def iter_chunks(sql, params=(), chunk_size=5000):
+    """Yield lists of at most chunk_size rows without materialising the full result."""
+    cursor = get_connection().execute(sql, params)
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield rows
+    finally:
+        cursor.close()
+
+
+def execute(sql, params=()):
+    """Run a single write statement in its own transaction and return the cursor."""
+    with transaction() as conn:
+        return conn.execute(sql, params)
+
+
+# ------------------------------------------------------------------
+# Change notifications
+# ------------------------------------------------------------------
+_listeners = []
+
+
+def add_listener(callback):
+    """Call callback(action, ids) after employees are inserted, updated or deleted."""
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def remove_listener(callback):
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def notify_change(action, ids):
+    """
+    Tell every listener that the rows with these ids were "insert"ed,
+    "update"d or "delete"d, or that too many rows changed to list and views
+    should "reload" (ids is then empty). Call it from the Tk thread, since
+    listeners update widgets.
+    """
+    ids = list(ids)
+    for callback in list(_listeners):
+        callback(action, ids)
+
+
+DELETE_CHUNK_SIZE = 500  # Ids per DELETE statement, well under SQLite's variable limit
+
+
+def delete_employees(ids):
+    """
+    Delete many employees in one transaction with chunked ``IN`` lists.
+
+    Returns:
+        int: Number of rows actually removed.
+    """
+    ids = list(ids)
+    deleted = 0
+    with transaction() as conn:
+        for start in range(0, len(ids), DELETE_CHUNK_SIZE):
+            chunk = ids[start:start + DELETE_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            deleted += conn.execute(f"DELETE FROM employees WHERE id IN ({placeholders})", chunk).rowcount
+    return deleted
+
+
+def fetch_by_ids(ids):
+    """Fetch full employee rows for the given ids."""
+    ids = list(ids)
+    if not ids:
+        return []
+    placeholders = ", ".join("?" for _ in ids)
+    return query(f"SELECT * FROM employees WHERE id IN ({placeholders}) ORDER BY id", ids)
+
+
+# ------------------------------------------------------------------
+# Targeted lookups (served by the indexes created in migrations.py)
+# ------------------------------------------------------------------
+LOOKUP_CHUNK_SIZE = 400  # (name, grade) pairs checked per statement
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+_ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+
+def employee_key(name, grade):
+    """
+    Normalized (name, grade) duplicate key, computed exactly like the
+    employees_name_grade_key index: lower(trim(name)), upper(trim(grade)).
+    SQLite's trim only removes spaces and its lower/upper only fold ASCII, so
+    the Python side does the same and both always agree.
+    """
+    return name.strip(" ").translate(_ASCII_LOWER), grade.strip(" ").translate(_ASCII_UPPER)
+
+
+def find_employee(name, grade):
+    """The employee whose normalized name and grade match, or None (one index lookup)."""
+    return query_one(
+        "SELECT * FROM employees WHERE lower(trim(name)) = ? AND upper(trim(grade)) = ? LIMIT 1",
+        employee_key(name, grade),
+    )
+
+
+def existing_employee_keys(keys):
+    """
+    Which employee_key() keys already belong to an employee. Each key is an
+    index lookup, so checking an import against a large table does not scan it.
+
+    Returns:
+        set: The subset of keys that exist.
+    """
+    keys = list(dict.fromkeys(keys))
+    found = set()
+    for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+        chunk = keys[start:start + LOOKUP_CHUNK_SIZE]
+        values = ", ".join("(?, ?)" for _ in chunk)
+        found.update(query(
+            f"""WITH k(name_key, grade_key) AS (VALUES {values})
+                SELECT name_key, grade_key FROM k WHERE EXISTS (
+                    SELECT 1 FROM employees
+                    WHERE lower(trim(name)) = k.name_key AND upper(trim(grade)) = k.grade_key)""",
+            [part for key in chunk for part in key],
+        ))
+    return found
+
+
+def fetch_salary_range(low=None, high=None, grade=None):
+    """Employees whose salary is between low and high (inclusive; either may be None), optionally in one grade."""
+    clauses = []
+    params = []
+    if grade is not None:
+        clauses.append("grade = ?")
+        params.append(grade)
+    if low is not None:
+        clauses.append("current_salary >= ?")
+        params.append(low)
+    if high is not None:
+        clauses.append("current_salary <= ?")
+        params.append(high)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return query(f"SELECT * FROM employees {where} ORDER BY current_salary", params)
+
+
+# ------------------------------------------------------------------
+# Employee name search
+# ------------------------------------------------------------------
+SEARCH_PAGE_SIZE = 500
+MIN_INDEXED_QUERY = 3   # The trigram index needs at least three characters
+
+_NAME_INDEX_SQL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS employee_names
+       USING fts5(name, content='employees', content_rowid='id', tokenize='trigram')""",
+    """CREATE TRIGGER IF NOT EXISTS employee_names_insert AFTER INSERT ON employees BEGIN
+           INSERT INTO employee_names(rowid, name) VALUES (new.id, new.name);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS employee_names_delete AFTER DELETE ON employees BEGIN
+           INSERT INTO employee_names(employee_names, rowid, name) VALUES ('delete', old.id, old.name);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS employee_names_update AFTER UPDATE OF name ON employees BEGIN
+           INSERT INTO employee_names(employee_names, rowid, name) VALUES ('delete', old.id, old.name);
+           INSERT INTO employee_names(rowid, name) VALUES (new.id, new.name);
+       END""",
+]
+
+
+def ensure_name_index():
+    """
+    Create the trigram full-text index over employee names and the triggers
+    that keep it in sync. Returns False if this SQLite build lacks FTS5.
+    """
+    exists = query_one("SELECT 1 FROM sqlite_master WHERE name = 'employee_names'")
+    try:
+        with transaction() as conn:
+            for statement in _NAME_INDEX_SQL:
+                conn.execute(statement)
+            if not exists:
+                conn.execute("INSERT INTO employee_names(employee_names) VALUES ('rebuild')")
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+def search_employee_names(text, prefix=False, limit=SEARCH_PAGE_SIZE, offset=0):
+    """
+    Case-insensitive name search returning one page of employee rows.
+
+    Args:
+        text: Substring to look for (or the start of the name when prefix is True).
+        limit, offset: Page of results to return, in employee id order.
+    """
+    text = text.strip()
+    if not text:
+        return query("SELECT * FROM employees ORDER BY id LIMIT ? OFFSET ?", (limit, offset))
+
+    position = "= 1" if prefix else "> 0"
+    if len(text) >= MIN_INDEXED_QUERY and query_one("SELECT 1 FROM sqlite_master WHERE name = 'employee_names'"):
+        phrase = '"' + text.replace('"', '""') + '"'
+        return query(
+            f"""SELECT e.* FROM employee_names f JOIN employees e ON e.id = f.rowid
+                WHERE employee_names MATCH ? AND instr(lower(e.name), lower(?)) {position}
+                ORDER BY f.rowid LIMIT ? OFFSET ?""",
+            (phrase, text, limit, offset),
+        )
+
+    # Too short for the trigram index: scan, but stop as soon as the page is full
+    return query(
+        f"SELECT * FROM employees WHERE instr(lower(name), lower(?)) {position} ORDER BY id LIMIT ? OFFSET ?",
+        (text, limit, offset),
+    )
+
+
+def name_matches(name, text, prefix=False):
+    """
+    Python twin of search_employee_names' filter, for checking single rows
+    without a query. Folds ASCII case only, like SQLite's lower.
+    """
+    text = text.strip().translate(_ASCII_LOWER)
+    name = name.translate(_ASCII_LOWER)
+    return name.startswith(text) if prefix else text in name
+
+
+@atexit.register
+def close_all():
+    """Close every pooled connection (called automatically at exit)."""
+    with _connections_lock:
+        while _connections:
+            _connections.pop().close()
+    _local.__dict__.pop("conn", None)
@@ -1,28 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import sqlite3
-import pathlib
-import pandas as pd
+from database import (add_listener, delete_employees, ensure_name_index, execute, fetch_by_ids, notify_change,
+                      query_one, remove_listener)
+from employee_store import EmployeeStore
+from migrations import migrate_database
+from grade_bands import bands
+from virtual_tree import VirtualTreeview
 
 # ------------------------------------------------------------------
 # Configuration
 # ------------------------------------------------------------------
-# Shared database file used by performance_evaluation.py
-DATABASE_FILE = pathlib.Path("employee_performance.db")
-
-# Grade definitions copied from performance_evaluation.py so both
-# scripts stay in‑sync. DO NOT edit here without also updating the
-# other script.
-GRADES_DATA = [
-    {"Grade": "112A", "Minimum": 32240, "Midpoint": 34600, "Maximum": 43700},
-    {"Grade": "113A", "Minimum": 32240, "Midpoint": 38000, "Maximum": 48000},
-    {"Grade": "114A", "Minimum": 32800, "Midpoint": 41900, "Maximum": 52500},
-    {"Grade": "115A", "Minimum": 34400, "Midpoint": 45900, "Maximum": 57600},
-    {"Grade": "116A", "Minimum": 38000, "Midpoint": 50600, "Maximum": 63700},
-    {"Grade": "117A", "Minimum": 41600, "Midpoint": 55500, "Maximum": 69700},
-]
-GRADES_DF = pd.DataFrame(GRADES_DATA).set_index("Grade")
-
+# Grade bands come from the shared registry in grade_bands.py
 SCORE_OPTIONS = [1, 2, 3, 4, 5]  # Valid performance scores
 
 # ------------------------------------------------------------------
@@ -30,26 +18,9 @@ SCORE_OPTIONS = [1, 2, 3, 4, 5]  # Valid performance scores
 # ------------------------------------------------------------------
 
 def init_database():
-    """Create the employees table if it doesn't exist."""
-    conn = sqlite3.connect(DATABASE_FILE)
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS employees (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            grade TEXT NOT NULL,
-            current_salary REAL NOT NULL,
-            score_y1 INTEGER,
-            score_y2 INTEGER,
-            score_y3 INTEGER,
-            score_y4 INTEGER,
-            score_y5 INTEGER
-        )
-        """
-    )
-    conn.commit()
-    conn.close()
+    """Create or upgrade the employees table (see migrations.py)."""
+    migrate_database()
+    ensure_name_index()
 
 
 # ------------------------------------------------------------------
@@ -75,7 +46,7 @@ def show_employee_form(parent, tree, employee=None, emp_id=None):
 
     # Grade
     ttk.Label(form, text="Grade:").pack(anchor="w", padx=20)
-    grade_combo = ttk.Combobox(form, values=list(GRADES_DF.index), state="readonly")
+    grade_combo = ttk.Combobox(form, values=list(bands.grades), state="readonly")
     grade_combo.pack(fill="x", padx=20, pady=4)
 
     # Salary
@@ -116,8 +87,8 @@ def show_employee_form(parent, tree, employee=None, emp_id=None):
             return
 
         # Validate grade
-        if grade not in GRADES_DF.index:
-            messagebox.showerror("Invalid Grade", f"Grade must be one of: {', '.join(GRADES_DF.index)}")
+        if grade not in bands:
+            messagebox.showerror("Invalid Grade", f"Grade must be one of: {', '.join(bands.grades)}")
             return
 
         # Collect scores
@@ -126,62 +97,68 @@ def show_employee_form(parent, tree, employee=None, emp_id=None):
             val = cb.get()
             scores.append(int(val) if val else None)
 
-        conn = sqlite3.connect(DATABASE_FILE)
-        cur = conn.cursor()
         if emp_id is None:
-            cur.execute(
+            cursor = execute(
                 """INSERT INTO employees
                        (name, grade, current_salary, score_y1, score_y2, score_y3, score_y4, score_y5)
                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
                 (name, grade, salary, *scores),
             )
+            notify_change("insert", [cursor.lastrowid])
         else:
-            cur.execute(
+            execute(
                 """UPDATE employees
                        SET name=?, grade=?, current_salary=?, score_y1=?, score_y2=?, score_y3=?, score_y4=?, score_y5=?
                        WHERE id=?""",
                 (name, grade, salary, *scores, emp_id),
             )
-        conn.commit()
-        conn.close()
-        load_employees(tree)
+            notify_change("update", [emp_id])
         form.destroy()
 
     ttk.Button(form, text="Save", command=save_record).pack(pady=5)
     ttk.Button(form, text="Cancel", command=form.destroy).pack()
 
 
+def employee_row(row):
+    """Treeview values and tag for one employee record."""
+    emp_id, name, grade, salary, y1, y2, y3, y4, y5 = row
+
+    # Simple flag if salary > grade max
+    flag = ""
+    maximum = bands.maximum(grade)
+    if maximum is None:
+        flag = "Unknown Grade"
+    elif salary > maximum:
+        flag = "Exceeds Max"
+
+    values = (emp_id, name, grade, f"{salary:,.2f}", y1, y2, y3, y4, y5, flag)
+    return values, "exceed" if flag.startswith("Exceeds") else None
+
+
 def load_employees(tree):
     """Populate the Treeview with employee records."""
-    # Clear
-    for item in tree.get_children():
-        tree.delete(item)
+    rows = []
+    tags = []
 
-    conn = sqlite3.connect(DATABASE_FILE)
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM employees")
-    rows = cur.fetchall()
-    conn.close()
+    for row in EmployeeStore.load().rows():
+        values, tag = employee_row(row)
+        rows.append(values)
+        tags.append(tag)
 
-    for row in rows:
-        emp_id, name, grade, salary, y1, y2, y3, y4, y5 = row
+    tree.set_rows(rows, tags)
+    tree.tag_configure("exceed", background="#ffcccc")
 
-        # Simple flag if salary > grade max
-        flag = ""
-        try:
-            if salary > GRADES_DF.loc[grade, "Maximum"]:
-                flag = "Exceeds Max"
-        except KeyError:
-            flag = "Unknown Grade"
-
-        tree.insert(
-            "", "end",
-            iid=str(emp_id),
-            values=(emp_id, name, grade, f"{salary:,.2f}", y1, y2, y3, y4, y5, flag),
-            tags=("exceed",) if flag.startswith("Exceeds") else ()
-        )
 
-    tree.tag_configure("exceed", background="#ffcccc")
+def apply_change(tree, action, ids):
+    """Update only the rows touched by a write instead of reloading the Treeview."""
+    if action == "reload":
+        load_employees(tree)
+        return
+    if action == "delete":
+        tree.remove_rows(ids)
+        return
+    for row in fetch_by_ids(ids):
+        tree.upsert_row(*employee_row(row))
 
 
 def edit_selected(tree, parent):
@@ -190,11 +167,7 @@ def edit_selected(tree, parent):
         messagebox.showwarning("No Selection", "Select a record first.")
         return
     emp_id = int(selected[0])
-    conn = sqlite3.connect(DATABASE_FILE)
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM employees WHERE id=?", (emp_id,))
-    employee = cur.fetchone()
-    conn.close()
+    employee = query_one("SELECT * FROM employees WHERE id=?", (emp_id,))
     if employee:
         show_employee_form(parent, tree, employee, emp_id)
 
@@ -204,19 +177,16 @@ def delete_selected(tree):
     if not selected:
         messagebox.showwarning("No Selection", "Select a record first.")
         return
-    emp_id = int(selected[0])
-    if not messagebox.askyesno("Confirm", f"Delete employee ID {emp_id}? This cannot be undone."):
+    emp_ids = [int(iid) for iid in selected]
+    target = f"employee ID {emp_ids[0]}" if len(emp_ids) == 1 else f"{len(emp_ids)} employees"
+    if not messagebox.askyesno("Confirm", f"Delete {target}? This cannot be undone."):
         return
-    conn = sqlite3.connect(DATABASE_FILE)
-    cur = conn.cursor()
-    cur.execute("DELETE FROM employees WHERE id=?", (emp_id,))
-    conn.commit()
-    conn.close()
-    load_employees(tree)
+    delete_employees(emp_ids)
+    notify_change("delete", emp_ids)
 
 
 def show_employee_manager(parent=None):
-    """Entry point: open Employee Manager window."""
+    """Entry point: open the Employee Manager window (a Toplevel of parent, or its own Tk root) and return it."""
     init_database()
 
     win = tk.Toplevel(parent) if parent else tk.Tk()
@@ -234,7 +204,7 @@ def show_employee_manager(parent=None):
 
     # Treeview
     cols = ("ID", "Name", "Grade", "Salary", "Y1", "Y2", "Y3", "Y4", "Y5", "Flag")
-    tree = ttk.Treeview(win, columns=cols, show="headings", height=15)
+    tree = VirtualTreeview(win, cols, height=15)
     for col in cols:
         tree.heading(col, text=col)
         tree.column(col, width=90 if col == "ID" else 100, anchor="center")
@@ -242,12 +212,16 @@ def show_employee_manager(parent=None):
 
     load_employees(tree)
 
+    # Keep the grid in step with writes from this and other windows
+    listener = lambda action, ids: apply_change(tree, action, ids)
+    add_listener(listener)
+    tree.bind("<Destroy>", lambda e: remove_listener(listener), add="+")
+
     # Double‑click to edit
     tree.bind("<Double-1>", lambda e: edit_selected(tree, win))
-
-    win.mainloop()
+    return win
 
 
 # If run directly, open the manager
 if __name__ == "__main__":
-    show_employee_manager()
+    show_employee_manager().mainloop()
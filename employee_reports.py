@@ -0,0 +1,140 @@
+"""
+Projection, budget and forecast reports shared by the Tk windows and
+hr_cli.py. Nothing here imports tkinter, so the command line runs on
+machines without a display or Tk installed.
+"""
+from database import DATABASE_FILE, query
+from employee_store import EmployeeStore
+from grade_bands import bands
+from projection_engine import (DEFAULT_INCREASE, crossing_year_constant, forecast_salaries, project_cached,
+                               score_increase)
+
+
+# ------------------------------------------------------------------
+# Score-driven projections
+# ------------------------------------------------------------------
+def project_records(store):
+    """Run the projection engine directly on an EmployeeStore's arrays."""
+    max_salaries = store.max_salaries()
+    progression, exceeded, projected = project_cached(store.salaries, max_salaries, store.scores)
+    return max_salaries, progression, exceeded, projected
+
+
+def evaluate_employees():
+    store = EmployeeStore.load()
+    if not len(store):
+        return []
+
+    _, progression, exceeded, projected = project_records(store)
+    results = []
+    for name, grade, yearly, exceeded_year, projected_exceed_year in zip(
+            store.names, store.grades(), progression.tolist(), exceeded.tolist(), projected.tolist()):
+        results.append((name, grade, *yearly, exceeded_year if exceeded_year else "Within Range", projected_exceed_year if projected_exceed_year else "Never"))
+
+    return results
+
+
+def raise_rate_sql(column):
+    """SQL CASE expression mapping a score column to its raise rate."""
+    cases = " ".join(f"WHEN {score} THEN :rate_{score}" for score in score_increase)
+    return f"CASE {column} {cases} ELSE :rate_default END"
+
+
+def combined_budget_query(years=5):
+    """
+    Build a query that compounds every salary inside SQLite and returns one
+    (year, total) row per projected year. Salaries are rounded to cents each
+    year with Python's round (py_round, see database.py), so the totals equal
+    the sum of the per-employee projections.
+    """
+    steps = []
+    for year in range(1, years + 1):
+        previous = "current_salary" if year == 1 else f"s{year - 1}"
+        carried = [f"s{y}" for y in range(1, year)] + [f"score_y{y}" for y in range(year + 1, years + 1)]
+        source = "employees" if year == 1 else f"y{year - 1}"
+        columns = ", ".join(carried + [f"py_round({previous} * (1 + {raise_rate_sql(f'score_y{year}')}), 2) AS s{year}"])
+        steps.append(f"y{year} AS (SELECT {columns} FROM {source})")
+
+    totals = ", ".join(f"TOTAL(s{year}) AS t{year}" for year in range(1, years + 1))
+    rows = " UNION ALL ".join(f"SELECT {year}, t{year} FROM totals" for year in range(1, years + 1))
+    return f"WITH {', '.join(steps)}, totals AS (SELECT {totals} FROM y{years}) {rows}"
+
+
+def calculate_combined_budget():
+    params = {f"rate_{score}": pct for score, pct in score_increase.items()}
+    params["rate_default"] = DEFAULT_INCREASE
+
+    return [total for _, total in query(combined_budget_query(), params)]
+
+
+# ------------------------------------------------------------------
+# Constant growth projection
+# ------------------------------------------------------------------
+def get_maximum_pay(grade):
+    return bands.maximum(grade, float('inf'))  # If grade not found, assume no limit
+
+
+GROWTH_RATE = 0.02
+YEARS = 5
+
+
+def salary_projection():
+    salary_projection_employees = []
+    salary_projection_total = [0] * (YEARS + 1)
+
+    # Check DB existence (raised so callers on worker threads can report it from the Tk thread)
+    if not DATABASE_FILE.exists():
+        raise FileNotFoundError(f"Database '{DATABASE_FILE}' not found.")
+
+    store = EmployeeStore.load()
+    maximum_pays = store.max_salaries(float('inf'))  # If grade not found, assume no limit
+    # Year each salary first passes its band maximum, solved for all employees at once
+    crossing_years = crossing_year_constant(store.salaries, maximum_pays, GROWTH_RATE, YEARS)
+
+    for employee_id, name, band, pay, maximum_pay, crossing in zip(
+            store.ids.tolist(), store.names, store.grades(), store.salaries.tolist(),
+            maximum_pays.tolist(), crossing_years.tolist()):
+        employee = ["did not exceed band", employee_id, name, band, pay]
+        salary_projection_total[0] += pay
+
+        # Check if Year 0 salary already exceeds the band
+        if pay > maximum_pay:
+            employee[0] = "Band exceeded in year 0"
+        elif crossing:
+            employee[0] = "Band exceeded in year " + str(crossing)
+
+        for year in range(1, YEARS + 1):
+            pay *= 1 + GROWTH_RATE
+            employee.append(pay)
+            salary_projection_total[year] += pay
+
+        salary_projection_employees.append(employee)
+
+    return salary_projection_employees, salary_projection_total
+
+
+# ------------------------------------------------------------------
+# Forecast at a fixed score
+# ------------------------------------------------------------------
+DEFAULT_FORECAST_SCORE = 3  # Score assumed for employees without an edited forecast
+
+
+def forecast_employees(store, year_index, forecasted_scores=None):
+    """
+    Salary of every employee after year_index years of their forecast score.
+
+    Args:
+        store: EmployeeStore to forecast.
+        forecasted_scores: Optional {employee id: score}; others get DEFAULT_FORECAST_SCORE.
+
+    Returns:
+        tuple: (scores, forecasted salaries, last year's forecasted salaries,
+        above band maximum flags), one entry per employee in store order.
+    """
+    forecasted_scores = forecasted_scores or {}
+    scores = [forecasted_scores.get(emp_id, DEFAULT_FORECAST_SCORE) for emp_id in store.ids.tolist()]
+    forecasted, last_year = forecast_salaries(store.salaries, scores, year_index)
+
+    # Check if forecasted salary exceeds the maximum salary of the grade band
+    exceeds_max = forecasted > store.max_salaries(0)
+    return scores, forecasted, last_year, exceeds_max
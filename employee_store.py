@@ -0,0 +1,92 @@
+import numpy as np
+
+from database import iter_chunks
+from grade_bands import bands
+
+YEARS = 5           # Score columns per employee
+MISSING_SCORE = 0   # Stored in the score matrix where a score is NULL or out of range
+
+
+def _score_matrix(columns):
+    """(employees, YEARS) uint8 matrix from score columns that may hold None."""
+    values = np.array(columns, dtype=float).T.reshape(-1, YEARS)
+    with np.errstate(invalid="ignore"):
+        valid = (values >= 1) & (values <= np.iinfo(np.uint8).max) & (values == np.floor(values))
+    return np.where(valid, values, MISSING_SCORE).astype(np.uint8)
+
+
+class EmployeeStore:
+    """
+    Employee records held as parallel typed arrays instead of row tuples.
+
+    Attributes:
+        ids: int32 employee ids.
+        names: List of names (the only per-row Python objects).
+        grade_codes: uint8 index into grade_labels for each employee.
+        grade_labels: Distinct grade strings in order of first appearance.
+        salaries: float64 current salaries.
+        scores: (employees, 5) uint8 Y1–Y5 scores, MISSING_SCORE where absent.
+
+    Rows cost roughly 20 bytes plus the name, against ~400 bytes for a
+    fetched tuple, and every column can be handed to numpy as is.
+    """
+
+    __slots__ = ("ids", "names", "grade_codes", "grade_labels", "salaries", "scores")
+
+    def __init__(self, ids, names, grade_codes, grade_labels, salaries, scores):
+        self.ids = ids
+        self.names = names
+        self.grade_codes = grade_codes
+        self.grade_labels = grade_labels
+        self.salaries = salaries
+        self.scores = scores
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        """Build a store from batches of ``SELECT * FROM employees`` rows."""
+        labels = {}
+        ids, names, codes, salaries, scores = [], [], [], [], []
+        for rows in chunks:
+            if not rows:
+                continue
+            chunk_ids, chunk_names, chunk_grades, chunk_salaries, *chunk_scores = zip(*rows)
+            ids.append(np.array(chunk_ids, dtype=np.int32))
+            names.extend(chunk_names)
+            codes.append(np.fromiter((labels.setdefault(grade, len(labels)) for grade in chunk_grades),
+                                     dtype=np.intp, count=len(rows)))
+            salaries.append(np.array(chunk_salaries, dtype=float))
+            scores.append(_score_matrix(chunk_scores))
+
+        if not ids:
+            return cls(np.zeros(0, dtype=np.int32), [], np.zeros(0, dtype=np.uint8), [],
+                       np.zeros(0), np.zeros((0, YEARS), dtype=np.uint8))
+        code_type = np.uint8 if len(labels) <= 256 else np.uint16
+        return cls(np.concatenate(ids), names, np.concatenate(codes).astype(code_type), list(labels),
+                   np.concatenate(salaries), np.concatenate(scores))
+
+    @classmethod
+    def from_rows(cls, rows):
+        return cls.from_chunks([rows])
+
+    @classmethod
+    def load(cls, sql="SELECT * FROM employees", params=()):
+        """Read employees straight into the arrays, one fetch chunk at a time."""
+        return cls.from_chunks(iter_chunks(sql, params))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def grades(self):
+        """Grade string of every employee."""
+        labels = self.grade_labels
+        return [labels[code] for code in self.grade_codes.tolist()]
+
+    def max_salaries(self, default=np.nan):
+        """Band maximum of every employee's grade, default where the grade has no band."""
+        return bands.maximums(self.grade_labels, default)[self.grade_codes]
+
+    def rows(self):
+        """Records as ``SELECT * FROM employees`` tuples (scores None where missing)."""
+        scores = [[score or None for score in row] for row in self.scores.tolist()]
+        return [(emp_id, name, grade, salary, *row) for emp_id, name, grade, salary, row in
+                zip(self.ids.tolist(), self.names, self.grades(), self.salaries.tolist(), scores)]
@@ -0,0 +1,151 @@
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+import numpy as np
+
+import projection_engine
+from database import query, transaction
+
+# Bands written to a new database: (Grade, Minimum, Midpoint, Maximum)
+DEFAULT_BANDS = [
+    ("112A", 32240, 34600, 43700),
+    ("113A", 32240, 38000, 48000),
+    ("114A", 32800, 41900, 52500),
+    ("115A", 34400, 45900, 57600),
+    ("116A", 38000, 50600, 63700),
+    ("117A", 41600, 55500, 69700),
+]
+
+UNKNOWN_CODE = 0  # Grade code used for grades that have no band
+
+_BANDS_SQL = """
+    CREATE TABLE IF NOT EXISTS grade_bands (
+        code INTEGER PRIMARY KEY,
+        grade TEXT NOT NULL UNIQUE,
+        minimum NUMERIC NOT NULL,
+        midpoint NUMERIC NOT NULL,
+        maximum NUMERIC NOT NULL
+    )
+"""
+
+
+# One immutable view of the table, published with a single assignment so
+# worker threads never see the dicts and arrays of two different loads
+_Snapshot = namedtuple("_Snapshot", ["bands", "codes", "limits"])
+
+
+class BandRegistry:
+    """
+    Salary bands for every grade, read once from the grade_bands table.
+
+    Each grade has a small integer code (its row id; 0 means unknown) that
+    indexes the minimum/midpoint/maximum arrays, so a lookup is one dict hit
+    instead of a pandas ``.loc`` per employee. Every reload tells the
+    projection cache (projection_engine.bands_changed) that band maximums may
+    have changed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # bands: grade -> (minimum, midpoint, maximum); codes: grade -> integer code;
+        # limits: (3, codes) array, column 0 is NaN for unknown grades
+        self._snapshot = None
+
+    def reload(self):
+        """(Re)read the table, creating it with DEFAULT_BANDS on first use."""
+        with self._lock:
+            with transaction() as conn:
+                conn.execute(_BANDS_SQL)
+                if conn.execute("SELECT 1 FROM grade_bands LIMIT 1").fetchone() is None:
+                    conn.executemany(
+                        "INSERT INTO grade_bands (grade, minimum, midpoint, maximum) VALUES (?, ?, ?, ?)",
+                        DEFAULT_BANDS,
+                    )
+                rows = conn.execute(
+                    "SELECT code, grade, minimum, midpoint, maximum FROM grade_bands ORDER BY grade"
+                ).fetchall()
+
+            limits = np.full((3, max((row[0] for row in rows), default=0) + 1), np.nan)
+            for code, grade, *band in rows:
+                limits[:, code] = band
+            limits.setflags(write=False)
+            self._snapshot = _Snapshot(
+                bands=MappingProxyType({grade: tuple(band) for _, grade, *band in rows}),
+                codes=MappingProxyType({grade: code for code, grade, *_ in rows}),
+                limits=limits,
+            )
+        projection_engine.bands_changed()
+
+    def _loaded(self):
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.reload()
+            snapshot = self._snapshot
+        return snapshot
+
+    def set_band(self, grade, minimum, midpoint, maximum):
+        """Add or change one grade's band and reload the registry."""
+        with transaction() as conn:
+            conn.execute(_BANDS_SQL)
+            conn.execute(
+                """INSERT INTO grade_bands (grade, minimum, midpoint, maximum) VALUES (?, ?, ?, ?)
+                   ON CONFLICT(grade) DO UPDATE SET
+                       minimum = excluded.minimum, midpoint = excluded.midpoint, maximum = excluded.maximum""",
+                (grade, minimum, midpoint, maximum),
+            )
+        self.reload()
+
+    # --------------------------------------------------------------
+    # Lookups
+    # --------------------------------------------------------------
+    @property
+    def grades(self):
+        """Known grade names, sorted."""
+        return tuple(self._loaded().bands)
+
+    def __contains__(self, grade):
+        return grade in self._loaded().bands
+
+    def rows(self):
+        """(grade, minimum, midpoint, maximum) for every band."""
+        return [(grade, *band) for grade, band in self._loaded().bands.items()]
+
+    def band(self, grade):
+        """(minimum, midpoint, maximum) for the grade, or None if it is unknown."""
+        return self._loaded().bands.get(grade)
+
+    def maximum(self, grade, default=None):
+        band = self._loaded().bands.get(grade)
+        return band[2] if band else default
+
+    def employees_over_band(self, ratio=1.0):
+        """
+        Employees paid more than ``ratio`` times their band maximum (ratio 0.9
+        also takes in those within 10% below it), read as one indexed salary
+        range per grade.
+        """
+        self._loaded()
+        return query(
+            """SELECT e.* FROM grade_bands b CROSS JOIN employees e
+               WHERE e.grade = b.grade AND e.current_salary > b.maximum * ?
+               ORDER BY e.id""",
+            (ratio,),
+        )
+
+    def codes(self, grades, snapshot=None):
+        """Integer code for each grade (UNKNOWN_CODE where it has no band)."""
+        get = (snapshot or self._loaded()).codes.get
+        return np.fromiter((get(grade, UNKNOWN_CODE) for grade in grades), dtype=np.intp)
+
+    def maximums(self, grades, default=np.nan):
+        """Band maximum for each grade as a float array, default where unknown."""
+        snapshot = self._loaded()
+        codes = self.codes(grades, snapshot)
+        values = snapshot.limits[2][codes]
+        if not np.isnan(default):
+            values[codes == UNKNOWN_CODE] = default
+        return values
+
+
+bands = BandRegistry()
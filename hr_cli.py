@@ -0,0 +1,229 @@
+"""
+Headless entry point: run projections, budgets, forecasts and exports
+against employee_performance.db without opening a window.
+
+    python hr_cli.py budget
+    python hr_cli.py evaluate -o evaluations.csv
+    python hr_cli.py simulate --trials 50000 --seed 7 -o budget.json
+    python hr_cli.py forecast --years 10 --score 4 -o forecast.parquet
+    python hr_cli.py export -o employees.csv.gz
+    python hr_cli.py export --grade G7 --min-salary 50000
+
+Output goes to stdout as CSV unless --output is given; the format follows
+the file extension (.csv, .json, .parquet, optionally .gz) or --format.
+"""
+import argparse
+import contextlib
+import csv
+import gzip
+import json
+import os
+import pathlib
+import sys
+
+from budget_simulation import DEFAULT_TRIALS, PERCENTILES, simulate_budget
+from database import fetch_salary_range, iter_chunks
+from employee_reports import YEARS, calculate_combined_budget, evaluate_employees, forecast_employees, salary_projection
+from employee_store import EmployeeStore
+from migrations import migrate_database
+
+FORMATS = ("csv", "json", "parquet")
+EMPLOYEE_COLUMNS = ["ID", "Name", "Grade", "Salary", "Y1", "Y2", "Y3", "Y4", "Y5"]
+
+
+# ------------------------------------------------------------------
+# Output
+# ------------------------------------------------------------------
+def output_format(path, requested=None):
+    """Format named on the command line, else the one the file extension implies (CSV by default)."""
+    if requested:
+        return requested
+    if path is None:
+        return "csv"
+    suffixes = [suffix.lstrip(".") for suffix in pathlib.Path(path).suffixes if suffix != ".gz"]
+    return suffixes[-1] if suffixes and suffixes[-1] in FORMATS else "csv"
+
+
+@contextlib.contextmanager
+def _open_text(path):
+    if path is None:
+        yield sys.stdout
+        return
+    path = pathlib.Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "wt", newline="", encoding="utf-8") as f:
+        yield f
+
+
+def write_table(columns, rows, path=None, fmt="csv"):
+    """
+    Write rows (any iterable of tuples) under the given column names.
+
+    CSV and JSON are streamed row by row; Parquet needs pandas with a Parquet
+    engine and a file path.
+
+    Returns:
+        int: Number of rows written.
+    """
+    if fmt == "parquet":
+        if path is None:
+            raise ValueError("Parquet output needs --output.")
+        import pandas as pd  # Only needed for Parquet output
+        frame = pd.DataFrame(list(rows), columns=columns)
+        frame.to_parquet(path, index=False)
+        return len(frame)
+
+    written = 0
+    with _open_text(path) as f:
+        if fmt == "json":
+            f.write("[")
+            for row in rows:
+                f.write(",\n" if written else "\n")
+                f.write(json.dumps(dict(zip(columns, row))))
+                written += 1
+            f.write("\n]\n")
+        else:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow(row)
+                written += 1
+    return written
+
+
+# ------------------------------------------------------------------
+# Commands: each returns (columns, rows)
+# ------------------------------------------------------------------
+def run_evaluate(args):
+    columns = ["Name", "Grade", "Y1", "Y2", "Y3", "Y4", "Y5", "Exceeded Year", "Min Score 3 Exceed Year"]
+    return columns, evaluate_employees()
+
+
+def run_budget(args):
+    totals = calculate_combined_budget()
+    return ["Year", "Total"], [(year, total) for year, total in enumerate(totals, 1)]
+
+
+def run_simulate(args):
+    store = EmployeeStore.load()
+    budget, exceed_probability = simulate_budget(store, args.trials, seed=args.seed, processes=args.processes)
+    if args.employees:
+        rows = zip(store.ids.tolist(), store.names, store.grades(), exceed_probability.tolist())
+        return ["ID", "Name", "Grade", "Exceed Probability"], rows
+    rows = [(year + 1, *(budget[p][year] for p in PERCENTILES)) for year in range(len(budget[PERCENTILES[0]]))]
+    return ["Year", *(f"P{p}" for p in PERCENTILES)], rows
+
+
+def run_projection(args):
+    employees, _ = salary_projection()
+    return ["Status", "ID", "Name", "Grade", *(f"Year {year}" for year in range(YEARS + 1))], employees
+
+
+def run_forecast(args):
+    store = EmployeeStore.load()
+    scores = {emp_id: args.score for emp_id in store.ids.tolist()} if args.score else None
+    scores, forecasted, last_year, exceeds = forecast_employees(store, args.years, scores)
+    columns = ["ID", "Name", "Grade", "Current Salary", "Forecasted Score", "Forecasted Salary",
+               "Last Year's Forecasted Salary", "Exceeds Maximum"]
+    rows = zip(store.ids.tolist(), store.names, store.grades(), store.salaries.tolist(), scores,
+               forecasted.tolist(), last_year.tolist(), exceeds.tolist())
+    return columns, rows
+
+
+def run_sweep(args):
+    from scenario_sweep import sweep_grades
+    sweep = sweep_grades(years=args.years)
+    rows = (("-".join(map(str, sequence)), *exceeded) for sequence, exceeded in
+            zip(sweep["sequences"].tolist(), sweep["exceeded_year"].tolist()))
+    return ["Scores", *sweep["grades"]], rows
+
+
+def run_over_band(args):
+    from grade_bands import bands
+    return EMPLOYEE_COLUMNS, bands.employees_over_band(args.ratio)
+
+
+def run_export(args):
+    if args.grade is not None or args.min_salary is not None or args.max_salary is not None:
+        return EMPLOYEE_COLUMNS, fetch_salary_range(args.min_salary, args.max_salary, args.grade)
+    rows = (row for chunk in iter_chunks("SELECT * FROM employees") for row in chunk)
+    return EMPLOYEE_COLUMNS, rows
+
+
+def positive_int(text):
+    """argparse type for counts that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run HR projections and reports without the GUI.")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-o", "--output", help="Output file (default: stdout)")
+    common.add_argument("-f", "--format", choices=FORMATS, help="Output format (default: from the file extension)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("evaluate", parents=[common], help="Five-year projection of every employee") \
+        .set_defaults(run=run_evaluate)
+    commands.add_parser("budget", parents=[common], help="Combined salary budget per year") \
+        .set_defaults(run=run_budget)
+
+    simulate = commands.add_parser("simulate", parents=[common], help="Monte Carlo budget percentiles per year")
+    simulate.add_argument("--trials", type=positive_int, default=DEFAULT_TRIALS)
+    simulate.add_argument("--seed", type=int)
+    simulate.add_argument("--processes", type=positive_int, help="Worker processes (default: one per CPU)")
+    simulate.add_argument("--employees", action="store_true",
+                          help="Write each employee's probability of exceeding their band instead")
+    simulate.set_defaults(run=run_simulate)
+
+    commands.add_parser("projection", parents=[common], help="Constant 2%% growth projection with band status") \
+        .set_defaults(run=run_projection)
+
+    forecast = commands.add_parser("forecast", parents=[common], help="Salaries after N years at a fixed score")
+    forecast.add_argument("--years", type=positive_int, default=1)
+    forecast.add_argument("--score", type=int, choices=range(1, 6), help="Score for every employee (default: 3)")
+    forecast.set_defaults(run=run_forecast)
+
+    sweep = commands.add_parser("sweep", parents=[common], help="Exceed year of every score sequence per grade")
+    sweep.add_argument("--years", type=positive_int, default=5)
+    sweep.set_defaults(run=run_sweep)
+
+    over_band = commands.add_parser("over-band", parents=[common], help="Employees paid above ratio × band maximum")
+    over_band.add_argument("--ratio", type=float, default=1.0)
+    over_band.set_defaults(run=run_over_band)
+
+    export = commands.add_parser("export", parents=[common],
+                                 help="Every employee record, or those in one grade or salary range")
+    export.add_argument("--grade", help="Only this grade")
+    export.add_argument("--min-salary", type=float, help="Lowest salary to include")
+    export.add_argument("--max-salary", type=float, help="Highest salary to include")
+    export.set_defaults(run=run_export)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    # Migration messages go to stderr so they never mix with table output on stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        migrate_database()
+
+    columns, rows = args.run(args)
+    fmt = output_format(args.output, args.format)
+    try:
+        written = write_table(columns, rows, args.output, fmt)
+    except BrokenPipeError:
+        # The reader (e.g. head) went away; point stdout at devnull so the
+        # interpreter's final flush does not fail a second time
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    except (ImportError, ValueError) as e:
+        raise SystemExit(f"Could not write {fmt}: {e}")
+    if args.output:
+        print(f"Wrote {written} row(s) to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,6 @@
 import pandas as pd
-
-# Static A-band salary data
-grades_data = [
-    {"Grade": "112A", "Minimum": 32240, "Midpoint": 34600, "Maximum": 43700},
-    {"Grade": "113A", "Minimum": 32240, "Midpoint": 38000, "Maximum": 48000},
-    {"Grade": "114A", "Minimum": 32800, "Midpoint": 41900, "Maximum": 52500},
-    {"Grade": "115A", "Minimum": 34400, "Midpoint": 45900, "Maximum": 57600},
-    {"Grade": "116A", "Minimum": 38000, "Midpoint": 50600, "Maximum": 63700},
-    {"Grade": "117A", "Minimum": 41600, "Midpoint": 55500, "Maximum": 69700},
-]
-
-# Score to increase rate mapping
-score_increase = {
-    1: 0.00,
-    2: 0.01,
-    3: 0.02,
-    4: 0.025,
-    5: 0.03
-}
+from grade_bands import bands
+from scenario_sweep import sweep_grades, sweep_progressions
 
 
 def simulate_grade_progression(performance_scores):
@@ -33,29 +16,19 @@ def simulate_grade_progression(performance_scores):
     if len(performance_scores) != 5:
         raise ValueError("You must provide exactly 5 performance scores (one per year).")
 
-    grades_df = pd.DataFrame(grades_data)
-    projection_results = []
-
-    for _, row in grades_df.iterrows():
-        grade = row["Grade"]
-        max_salary = row["Maximum"]
-        current_salary = row["Midpoint"]
-        exceeded_year = None
-        salary_progression = []
-
-        for year in range(1, 6):
-            score = performance_scores[year - 1]
-            increase_rate = score_increase.get(score, 0.00)
-            current_salary *= (1 + increase_rate)
-            current_salary = round(current_salary, 2)
-            salary_progression.append(current_salary)
-
-            if exceeded_year is None and current_salary > max_salary:
-                exceeded_year = year
+    rows = bands.rows()
+    progression, exceeded = sweep_progressions(
+        [midpoint for _, _, midpoint, _ in rows],
+        [max_salary for _, _, _, max_salary in rows],
+        [performance_scores],
+    )
 
+    projection_results = []
+    for (grade, _, midpoint, max_salary), salary_progression, exceeded_year in zip(
+            rows, progression[0].tolist(), exceeded[0].tolist()):
         projection_results.append({
             "Grade": grade,
-            "Initial Midpoint": row["Midpoint"],
+            "Initial Midpoint": midpoint,
             "Max Salary": max_salary,
             "Year 1": salary_progression[0],
             "Year 2": salary_progression[1],
@@ -67,6 +40,20 @@ def simulate_grade_progression(performance_scores):
 
     return pd.DataFrame(projection_results)
 
+def sweep_grade_progression(years=5):
+    """
+    Exceed-year lookup table for every score sequence over ``years`` years
+    against every grade (memoized on disk, see scenario_sweep.sweep_grades).
+
+    Returns:
+        pd.DataFrame: One row per score sequence, one exceeded-year column per
+        grade (0 when the band maximum is never passed).
+    """
+    sweep = sweep_grades(years=years)
+    table = pd.DataFrame(sweep["exceeded_year"], columns=list(sweep["grades"]))
+    table.insert(0, "Scores", ["-".join(map(str, sequence)) for sequence in sweep["sequences"].tolist()])
+    return table
+
 def main():
     # Define the performance scores for 5 years
     performance_scores = [3, 3, 3, 3, 3]  # Modify this list as needed
@@ -78,4 +65,5 @@ def main():
     print("\nSalary Projection Based on Performance Scores:")
     print(results_df)
 
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
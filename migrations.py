@@ -0,0 +1,89 @@
+from database import get_connection
+
+# ------------------------------------------------------------------
+# Migration runner
+# ------------------------------------------------------------------
+def current_version(conn):
+    """Schema version recorded in the database (0 for a new or legacy file)."""
+    conn.execute("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)")
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def migrate(conn, migrations):
+    """
+    Apply the migrations the database has not seen yet, in order.
+
+    Args:
+        conn: Open sqlite3 connection.
+        migrations: Ordered list of callables taking the connection; the
+            database is at version N once the first N have run. Steps are
+            never edited or reordered once released, only appended.
+
+    Each step runs in its own BEGIN IMMEDIATE transaction that re-reads the
+    version first, so concurrent callers apply every step exactly once.
+
+    Returns:
+        int: Schema version after migrating. When the database is already
+        current this is a single query.
+    """
+    version = current_version(conn)
+    while version < len(migrations):
+        # Take the write lock before reading the version again, so a window
+        # and the launcher's startup thread migrating at the same time never
+        # both apply a step
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = current_version(conn)
+            if version >= len(migrations):
+                conn.commit()
+                break
+            number, step = version + 1, migrations[version]
+            step(conn)
+            conn.execute("INSERT INTO schema_version (version) VALUES (?)", (number,))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        print(f"Applied migration {number}: {step.__doc__}")
+        version = number
+    return max(version, len(migrations))
+
+
+# ------------------------------------------------------------------
+# employee_performance.db (the one database every window uses)
+# ------------------------------------------------------------------
+def _create_employees(conn):
+    """create employees table"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS employees (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            grade TEXT NOT NULL,
+            current_salary REAL NOT NULL,
+            score_y1 INTEGER,
+            score_y2 INTEGER,
+            score_y3 INTEGER,
+            score_y4 INTEGER,
+            score_y5 INTEGER,
+            UNIQUE(name, grade)
+        )
+    """)
+
+
+def _add_lookup_indexes(conn):
+    """index employees by normalized (name, grade), by grade and salary, and by salary"""
+    conn.execute("CREATE INDEX IF NOT EXISTS employees_name_grade_key ON employees(lower(trim(name)), upper(trim(grade)))")
+    conn.execute("CREATE INDEX IF NOT EXISTS employees_grade_salary ON employees(grade, current_salary)")
+    conn.execute("CREATE INDEX IF NOT EXISTS employees_salary ON employees(current_salary)")
+
+
+MIGRATIONS = [
+    _create_employees,
+    _add_lookup_indexes,
+]
+
+
+def migrate_database():
+    """Bring employee_performance.db up to date; cheap once it is current."""
+    return migrate(get_connection(), MIGRATIONS)
@@ -1,179 +1,202 @@
+import csv
+import gzip
+import os
+import pathlib
 import sqlite3
 import tkinter as tk
-from tkinter import messagebox, ttk
-import pandas as pd
-import pathlib
-
-# Set database file path
-database_file = pathlib.Path("employee_performance.db")
-
-# Grade band definitions
-grades_data = [
-    {"Grade": "112A", "Minimum": 32240, "Midpoint": 34600, "Maximum": 43700},
-    {"Grade": "113A", "Minimum": 32240, "Midpoint": 38000, "Maximum": 48000},
-    {"Grade": "114A", "Minimum": 32800, "Midpoint": 41900, "Maximum": 52500},
-    {"Grade": "115A", "Minimum": 34400, "Midpoint": 45900, "Maximum": 57600},
-    {"Grade": "116A", "Minimum": 38000, "Midpoint": 50600, "Maximum": 63700},
-    {"Grade": "117A", "Minimum": 41600, "Midpoint": 55500, "Maximum": 69700},
-]
-grades_df = pd.DataFrame(grades_data).set_index("Grade")
-score_increase = {1: 0.00, 2: 0.01, 3: 0.02, 4: 0.025, 5: 0.03}
+from tkinter import messagebox
+from grade_bands import bands
+from database import (SEARCH_PAGE_SIZE, add_listener, delete_employees, employee_key, ensure_name_index, execute,
+                      existing_employee_keys, fetch_by_ids, find_employee, iter_chunks, name_matches, notify_change,
+                      query, query_one, remove_listener, search_employee_names, transaction)
+from employee_store import EmployeeStore
+from migrations import migrate_database
+from budget_simulation import DEFAULT_TRIALS, simulate_budget
+from employee_reports import calculate_combined_budget, evaluate_employees, project_records
+from projection_engine import score_increase
+from task_runner import run_in_background
+from virtual_tree import VirtualTreeview
 
 # --- Database Functions ---
 
 def create_database():
-    conn = sqlite3.connect(database_file)
-    cur = conn.cursor()
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS employees (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT NOT NULL,
-        grade TEXT NOT NULL,
-        current_salary REAL NOT NULL,
-        score_y1 INTEGER,
-        score_y2 INTEGER,
-        score_y3 INTEGER,
-        score_y4 INTEGER,
-        score_y5 INTEGER,
-        UNIQUE(name, grade)
-    )
-    """)
-    conn.commit()
-    conn.close()
+    migrate_database()
+    ensure_name_index()
 
 def insert_employee(name, grade, salary, scores):
-    conn = sqlite3.connect(database_file)
-    cur = conn.cursor()
-    try:
-        cur.execute("""
+    cursor = execute("""
+        INSERT INTO employees (name, grade, current_salary, score_y1, score_y2, score_y3, score_y4, score_y5)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, (name, grade, salary, *scores))
+    notify_change("insert", [cursor.lastrowid])
+
+def insert_employees(rows):
+    """Insert many (name, grade, salary, y1..y5) rows in a single transaction."""
+    with transaction() as conn:
+        conn.executemany("""
             INSERT INTO employees (name, grade, current_salary, score_y1, score_y2, score_y3, score_y4, score_y5)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (name, grade, salary, *scores))
-        conn.commit()
-    finally:
-        conn.close()
+        """, rows)
 
 def fetch_employees():
-    conn = sqlite3.connect(database_file)
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM employees")
-    rows = cur.fetchall()
-    conn.close()
-    return rows
-
-# --- Data Processing ---
-
-def evaluate_employees():
-    employees = fetch_employees()
-    results = []
-
-    for emp in employees:
-        emp_id, name, grade, salary, *scores = emp
-        max_salary = grades_df.loc[grade]["Maximum"]
-        exceeded_year = None
-        progression = []
-
-        for year, score in enumerate(scores, start=1):
-            raise_pct = score_increase.get(score, 0.02)
-            salary *= (1 + raise_pct)
-            salary = round(salary, 2)
-            progression.append(salary)
-            if exceeded_year is None and salary > max_salary:
-                exceeded_year = year
-
-        projected_salary = emp[3]
-        projected_exceed_year = None
-        for year in range(1, 6):
-            projected_salary *= (1 + score_increase[3])
-            projected_salary = round(projected_salary, 2)
-            if projected_exceed_year is None and projected_salary > max_salary:
-                projected_exceed_year = year
-                break
-
-        results.append((name, grade, *progression, exceeded_year if exceeded_year else "Within Range", projected_exceed_year if projected_exceed_year else "Never"))
-
-    return results
-
-def calculate_combined_budget():
-    employees = fetch_employees()
-    yearly_totals = [0] * 5
-    for emp in employees:
-        salary = emp[3]
-        scores = emp[4:9]
-        for i, score in enumerate(scores):
-            raise_pct = score_increase.get(score, 0.02)
-            salary *= (1 + raise_pct)
-            salary = round(salary, 2)
-            yearly_totals[i] += salary
-    return yearly_totals
+    return query("SELECT * FROM employees")
+
 
 # --- CSV I/O ---
 
-def export_to_csv():
-    employees = fetch_employees()
-    df = pd.DataFrame(employees, columns=["ID", "Name", "Grade", "Salary", "Y1", "Y2", "Y3", "Y4", "Y5"])
+EXPORT_HEADER = ["ID", "Name", "Grade", "Salary", "Y1", "Y2", "Y3", "Y4", "Y5"]
+EXPORT_CHUNK_SIZE = 5000
+
+def write_employees_csv(path="employee_export.csv", compress=None, chunk_size=EXPORT_CHUNK_SIZE, progress=None):
+    """
+    Stream the employees table to a CSV file in fixed-size chunks.
+
+    Args:
+        path: Output file; gzip-compressed when compress is True or the name ends in ".gz".
+        chunk_size: Rows fetched from SQLite and written per batch.
+        progress: Optional callable(rows_written, total_rows) run after every batch.
+
+    Returns:
+        int: Number of employee rows written.
+    """
+    path = pathlib.Path(path)
+    if compress is None:
+        compress = path.suffix == ".gz"
+    total = query_one("SELECT COUNT(*) FROM employees")[0] if progress else None
+
+    # Written next to the target and moved over it only once complete, so a
+    # failed or cancelled export never truncates the existing file
+    partial = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    opener = gzip.open if compress else open
+    written = 0
     try:
-        df.to_csv("employee_export.csv", index=False)
-        messagebox.showinfo("Export Successful", "Data exported to 'employee_export.csv'")
-    except Exception as e:
-        messagebox.showerror("Export Failed", str(e))
+        with opener(partial, "wt", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_HEADER)
+            for rows in iter_chunks("SELECT * FROM employees", chunk_size=chunk_size):
+                writer.writerows(rows)
+                written += len(rows)
+                if progress:
+                    progress(written, total)
+        os.replace(partial, path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    return written
+
+def export_to_csv(parent, path="employee_export.csv", compress=None):
+    run_in_background(
+        parent, write_employees_csv, path, compress=compress, pass_progress=True, title="Exporting employees…",
+        on_done=lambda written: messagebox.showinfo("Export Successful", f"Data exported to '{path}'"),
+        on_error=lambda e: messagebox.showerror("Export Failed", str(e)),
+    )
 
-def import_from_csv():
-    try:
-        df = pd.read_csv("employee_export.csv")
-        added = 0
-        skipped = 0
-        existing = {(emp[1].strip().lower(), emp[2].strip().upper()) for emp in fetch_employees()}
-
-        for _, row in df.iterrows():
-            key = (row["Name"].strip().lower(), row["Grade"].strip().upper())
-            if key in existing:
-                skipped += 1
-                continue
-
-            insert_employee(
-                row["Name"],
-                row["Grade"],
-                row["Salary"],
-                [row["Y1"], row["Y2"], row["Y3"], row["Y4"], row["Y5"]]
-            )
-            added += 1
-            existing.add(key)  # So future rows in the same CSV aren't inserted twice
-
-        display_records()
+CSV_COLUMNS = ["Name", "Grade", "Salary", "Y1", "Y2", "Y3", "Y4", "Y5"]
+SCORE_COLUMNS = ["Y1", "Y2", "Y3", "Y4", "Y5"]
+
+def prepare_import(df):
+    """
+    Validate an imported DataFrame column by column and drop duplicate employees.
+
+    Returns:
+        tuple: (rows ready for insert_employees, number of duplicates skipped)
+    """
+    import pandas as pd  # Only needed for CSV import, so not loaded with the window
+
+    missing = [col for col in CSV_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+
+    names = df["Name"].astype("string").str.strip()
+    grades = df["Grade"].astype("string").str.strip().str.upper()
+    salaries = pd.to_numeric(df["Salary"], errors="coerce")
+    scores = df[SCORE_COLUMNS].apply(pd.to_numeric, errors="coerce")
+
+    invalid = names.isna() | (names == "") | grades.isna() | salaries.isna()
+    invalid |= (scores.notna() & ~scores.isin(list(score_increase))).any(axis=1)
+    if invalid.any():
+        lines = ", ".join(str(i + 2) for i in df.index[invalid][:10])
+        raise ValueError(f"Invalid name, grade, salary or score on CSV line(s): {lines}")
+
+    # Same (name, grade) key as the duplicate check in submit_form
+    keys = [employee_key(name, grade) for name, grade in zip(names, grades)]
+    seen = existing_employee_keys(keys)
+    keep = []
+    for key in keys:
+        keep.append(key not in seen)
+        seen.add(key)
+    keep = pd.Series(keep, index=df.index)
+
+    data = pd.concat([df[["Name", "Grade"]], salaries, scores], axis=1)[keep].astype(object)
+    rows = list(data.where(data.notna(), None).itertuples(index=False, name=None))
+    return rows, int((~keep).sum())
+
+def import_employees_csv(path="employee_export.csv"):
+    """Read, validate and insert an exported CSV (runs on a worker thread); returns (added, skipped)."""
+    import pandas as pd
+    df = pd.read_csv(path)
+    rows, skipped = prepare_import(df)
+    insert_employees(rows)
+    return len(rows), skipped
+
+def import_from_csv(parent):
+    def show_result(result):
+        added, skipped = result
+        # One coarse notice instead of every new id, which could be 150k rows
+        notify_change("reload", [])
         messagebox.showinfo("Import Complete", f"Added: {added} entries\nSkipped: {skipped} duplicates.")
-    except Exception as e:
-        messagebox.showerror("Import Failed", str(e))
+
+    run_in_background(parent, import_employees_csv, on_done=show_result, title="Importing employees…",
+                      on_error=lambda e: messagebox.showerror("Import Failed", str(e)))
 
 # --- UI Functions ---
 
-def show_salary_budget():
+def show_salary_budget(parent, tree):
     selected = tree.selection()
 
     if selected:
         # Show total for selected employee
         emp = tree.item(selected[0])['values']
         name = emp[1]
-        salary = float(emp[3])
-        scores = list(map(int, emp[4:9]))  # Y1-Y5 scores
-
-        total = salary
-        for score in scores:
-            raise_pct = score_increase.get(score, 0.02)
-            total *= (1 + raise_pct)
-            total = round(total, 2)
+        _, progression, _, _ = project_records(EmployeeStore.from_rows([emp[:9]]))
+        total = float(progression[0, -1])
 
         message = f"Projected 5-Year Total Salary for {name}:\n${total:,.2f}"
         messagebox.showinfo("Employee Salary Projection", message)
 
     else:
         # Fallback to show total for all employees
-        totals = calculate_combined_budget()
-        message = "Combined Salary Budget (All Employees):\n"
-        message += "\n".join([f"Year {i + 1}: ${totals[i]:,.2f}" for i in range(5)])
-        messagebox.showinfo("Combined Budget Forecast", message)
-
-def delete_selected_employee():
+        def show_totals(totals):
+            message = "Combined Salary Budget (All Employees):\n"
+            message += "\n".join([f"Year {i + 1}: ${totals[i]:,.2f}" for i in range(5)])
+            messagebox.showinfo("Combined Budget Forecast", message)
+
+        run_in_background(parent, calculate_combined_budget, on_done=show_totals, title="Calculating budget…")
+
+def simulate_employee_budget(trials=DEFAULT_TRIALS, progress=None):
+    """Monte Carlo budget for every employee; returns (store, percentiles, exceed probabilities)."""
+    store = EmployeeStore.load()
+    budget, exceed_probability = simulate_budget(store, trials, progress=progress)
+    return store, budget, exceed_probability
+
+def show_budget_simulation(parent):
+    def show_results(result):
+        store, budget, exceed_probability = result
+        message = f"Simulated Salary Budget ({DEFAULT_TRIALS:,} trials):\n"
+        message += "\n".join(
+            f"Year {year + 1}: " + ", ".join(f"P{p} ${totals[year]:,.2f}" for p, totals in budget.items())
+            for year in range(5)
+        )
+        likely = [i for i in exceed_probability.argsort()[::-1].tolist() if exceed_probability[i] >= 0.5]
+        if likely:
+            message += f"\n\nLikely to exceed their band maximum: {len(likely)} employee(s)\n"
+            message += "\n".join(f"{store.names[i]}: {exceed_probability[i]:.0%}" for i in likely[:10])
+        messagebox.showinfo("Budget Simulation", message)
+
+    run_in_background(parent, simulate_employee_budget, on_done=show_results, pass_progress=True,
+                      title="Simulating budget…")
+
+def delete_selected_employee(tree):
     selected_items = tree.selection()
     if not selected_items:
         messagebox.showwarning("No Selection", "Please select one or more rows to delete.")
@@ -183,28 +206,21 @@ def delete_selected_employee():
     if not confirm:
         return
 
-    conn = sqlite3.connect(database_file)
-    cur = conn.cursor()
-    for item in selected_items:
-        emp_id = tree.item(item)['values'][0]
-        cur.execute("DELETE FROM employees WHERE id = ?", (emp_id,))
-    conn.commit()
-    conn.close()
-    display_records()
-    messagebox.showinfo("Deleted", f"{len(selected_items)} record(s) deleted.")
-
-def submit_form():
-    name = name_entry.get()
+    emp_ids = [tree.row(item)[0] for item in selected_items]
+    deleted = delete_employees(emp_ids)
+    notify_change("delete", emp_ids)
+    messagebox.showinfo("Deleted", f"{deleted} record(s) deleted.")
+
+def submit_form(name_entry, grade_entry, salary_entry, score_entries):
+    name = name_entry.get().strip()
     grade = grade_entry.get().strip().upper()
 
-    employees = fetch_employees()
-    for emp in employees:
-        if emp[1].strip().lower() == name.strip().lower() and emp[2].strip().upper() == grade:
-            messagebox.showerror("Duplicate Entry", f"Employee '{name}' with Grade '{grade}' already exists.")
-            return
+    if find_employee(name, grade):
+        messagebox.showerror("Duplicate Entry", f"Employee '{name}' with Grade '{grade}' already exists.")
+        return
 
-    if grade not in grades_df.index:
-        messagebox.showerror("Invalid Grade", f"Grade '{grade}' is not recognized.\nValid options: {', '.join(grades_df.index)}")
+    if grade not in bands:
+        messagebox.showerror("Invalid Grade", f"Grade '{grade}' is not recognized.\nValid options: {', '.join(bands.grades)}")
         return
 
     try:
@@ -221,170 +237,244 @@ def submit_form():
         messagebox.showinfo("Success", f"Record for {name} added!")
         for entry in [name_entry, grade_entry, salary_entry] + score_entries:
             entry.delete(0, tk.END)
-        display_records()
     except sqlite3.IntegrityError:
         messagebox.showerror("Database Error", f"Employee '{name}' with Grade '{grade}' already exists.")
 
-def display_records():
-    for row in tree.get_children():
-        tree.delete(row)
-
-    for emp in fetch_employees():
-        emp_id, name, grade, salary, y1, y2, y3, y4, y5 = emp
-        max_salary = grades_df.loc[grade]["Maximum"]
-        sal = salary
-        exceeded_year = None
-
-        for i, score in enumerate([y1, y2, y3, y4, y5], start=1):
-            raise_pct = score_increase.get(score, 0.02)
-            sal *= (1 + raise_pct)
-            sal = round(sal, 2)
-            if exceeded_year is None and sal > max_salary:
-                exceeded_year = i
-
-        flag = "✓ Within Band"
-        if exceeded_year:
-            flag = "⚠ Exceeded Band"
-        elif round(sal, 2) == max_salary:
-            flag = "⚠ At Band Limit"
-
-        tag = "exceeded" if flag != "✓ Within Band" else "normal"
-
-        tree.insert("", tk.END, values=(
-            emp_id, name, grade, salary, y1, y2, y3, y4, y5,
-            max_salary, exceeded_year if exceeded_year else "—", flag
-        ), tags=(tag,))
-
+def tree_rows(store):
+    """Grid values and tag for each employee in an EmployeeStore, with its projection applied."""
+    rows = []
+    tags = []
+    if len(store):
+        max_salaries, progression, exceeded, _ = project_records(store)
+        for emp, max_salary, final_salary, exceeded_year in zip(
+                store.rows(), max_salaries.tolist(), progression[:, -1].tolist(), exceeded.tolist()):
+            emp_id, name, grade, salary, y1, y2, y3, y4, y5 = emp
+
+            flag = "✓ Within Band"
+            if exceeded_year:
+                flag = "⚠ Exceeded Band"
+            elif final_salary == max_salary:
+                flag = "⚠ At Band Limit"
+
+            tags.append("exceeded" if flag != "✓ Within Band" else "normal")
+            rows.append((
+                emp_id, name, grade, salary, y1, y2, y3, y4, y5,
+                bands.maximum(grade), exceeded_year if exceeded_year else "—", flag
+            ))
+    return rows, tags
+
+def populate_tree(tree, store):
+    show_tree_rows(tree, *tree_rows(store))
+
+def show_tree_rows(tree, rows, tags):
+    tree.set_rows(rows, tags)
     tree.tag_configure("exceeded", background="#ffe6e6")
     tree.tag_configure("normal", background="#e6ffe6")
 
-def search_employees(query):
-    for row in tree.get_children():
-        tree.delete(row)
-
-    for emp in fetch_employees():
-        emp_id, name, grade, salary, y1, y2, y3, y4, y5 = emp
-        if query.lower() not in name.lower():
-            continue
-
-        max_salary = grades_df.loc[grade]["Maximum"]
-        sal = salary
-        exceeded_year = None
-
-        for i, score in enumerate([y1, y2, y3, y4, y5], start=1):
-            raise_pct = score_increase.get(score, 0.02)
-            sal *= (1 + raise_pct)
-            sal = round(sal, 2)
-            if exceeded_year is None and sal > max_salary:
-                exceeded_year = i
-
-        flag = "✓ Within Band"
-        if exceeded_year:
-            flag = "⚠ Exceeded Band"
-        elif round(sal, 2) == max_salary:
-            flag = "⚠ At Band Limit"
-
-        tag = "exceeded" if flag != "✓ Within Band" else "normal"
-
-        tree.insert("", tk.END, values=(
-            emp_id, name, grade, salary, y1, y2, y3, y4, y5,
-            max_salary, exceeded_year if exceeded_year else "—", flag
-        ), tags=(tag,))
-
-    tree.tag_configure("exceeded", background="#ffe6e6")
-    tree.tag_configure("normal", background="#e6ffe6")
+def on_employees_changed(tree, action, ids, search_text=""):
+    """
+    Apply a write to just the affected grid rows instead of reloading the
+    grid. While a search is shown, only rows whose name still matches it are
+    added or updated; the rest are taken off the grid.
+    """
+    if action == "delete":
+        tree.remove_rows(ids)
+        return
+    employees = fetch_by_ids(ids)
+    if search_text.strip():
+        tree.remove_rows([emp[0] for emp in employees if not name_matches(emp[1], search_text)])
+        employees = [emp for emp in employees if name_matches(emp[1], search_text)]
+    for row, tag in zip(*tree_rows(EmployeeStore.from_rows(employees))):
+        tree.upsert_row(row, tag)
+
+SEARCH_DELAY_MS = 250  # Typing pause before the grid is searched
+
+def load_tree_rows():
+    """Grid rows and tags for every employee (runs on a worker thread)."""
+    return tree_rows(EmployeeStore.load())
+
+def display_records(tree):
+    """Reload the whole grid on a worker thread; returns the Task so a newer view can cancel it."""
+    return run_in_background(tree, load_tree_rows, on_done=lambda result: show_tree_rows(tree, *result),
+                             title="Loading employees…")
+
+def search_employees(tree, text, offset=0):
+    """
+    Show the page of name matches starting at offset; later pages are added
+    below the rows already shown. Blank text shows every employee.
+
+    Returns:
+        bool: True when the page was full, so more matches may follow.
+    """
+    if not text.strip():
+        display_records(tree)
+        return False
+    page = search_employee_names(text, offset=offset)
+    if offset:
+        tree.upsert_rows(*tree_rows(EmployeeStore.from_rows(page)))
+    else:
+        populate_tree(tree, EmployeeStore.from_rows(page))
+    return len(page) == SEARCH_PAGE_SIZE
 
-def show_evaluations():
-    eval_win = tk.Toplevel(root)
+def show_evaluations(parent):
+    eval_win = tk.Toplevel(parent)
     eval_win.title("Salary Projections")
     cols = ("Name", "Grade", "Y1", "Y2", "Y3", "Y4", "Y5", "Exceeded Year", "Min Score 3 Exceed Year")
-    eval_tree = ttk.Treeview(eval_win, columns=cols, show='headings')
+    eval_tree = VirtualTreeview(eval_win, cols, key_column=None)
     for col in cols:
         eval_tree.heading(col, text=col)
     eval_tree.pack(fill='both', expand=True)
 
-    for row in evaluate_employees():
-        eval_tree.insert("", tk.END, values=row)
+    run_in_background(eval_win, evaluate_employees, on_done=eval_tree.set_rows, title="Projecting salaries…")
 
 # --- Build UI ---
 
-create_database()
-root = tk.Tk()
-root.title("Employee Performance Database")
-root.geometry("1000x650")          # Initial size
-root.minsize(900, 600)             # Minimum size to ensure layout fits on smaller screens
-
-form_frame = tk.Frame(root)
-form_frame.grid(row=0, column=0, columnspan=10, sticky="w", padx=10, pady=5)
-
-tk.Label(form_frame, text="Name").grid(row=0, column=0, sticky="w")
-name_entry = tk.Entry(form_frame)
-name_entry.grid(row=0, column=1, padx=5)
-
-tk.Label(form_frame, text="Grade").grid(row=1, column=0, sticky="w")
-grade_entry = tk.Entry(form_frame)
-grade_entry.grid(row=1, column=1, padx=5)
-
-tk.Label(form_frame, text="Current Salary").grid(row=2, column=0, sticky="w")
-salary_entry = tk.Entry(form_frame)
-salary_entry.grid(row=2, column=1, padx=5)
-
-tk.Label(form_frame, text="Scores (Y1–Y5)").grid(row=3, column=0, sticky="w")
-
-scores_frame = tk.Frame(form_frame)
-scores_frame.grid(row=3, column=1, sticky="w", padx=(5, 0))  # << Add this padx
-
-score_entries = [tk.Entry(scores_frame, width=4) for _ in range(5)]
-for i, entry in enumerate(score_entries):
-    entry.grid(row=0, column=i, padx=4)
-
-# Create a centered button frame
-button_frame = tk.Frame(root)
-button_frame.grid(row=4, column=0, columnspan=10, pady=10)
-
-submit_btn = tk.Button(button_frame, text="Add Employee", command=submit_form)
-submit_btn.pack(side=tk.LEFT, padx=10)
-
-eval_btn = tk.Button(button_frame, text="Show Salary Projections", command=show_evaluations)
-eval_btn.pack(side=tk.LEFT, padx=10)
-
-budget_btn = tk.Button(button_frame, text="Show Combined Budget", command=show_salary_budget)
-budget_btn.pack(side=tk.LEFT, padx=10)
-
-delete_btn = tk.Button(button_frame, text="Delete Selected", command=delete_selected_employee)
-delete_btn.pack(side=tk.LEFT, padx=10)
-
-import_btn = tk.Button(button_frame, text="Import CSV", command=import_from_csv)
-import_btn.pack(side=tk.LEFT, padx=10)
-
-export_btn = tk.Button(button_frame, text="Export CSV", command=export_to_csv)
-export_btn.pack(side=tk.LEFT, padx=10)
-
-tk.Label(button_frame, text="Search Name:").pack(side=tk.LEFT, padx=5)
-search_entry = tk.Entry(button_frame, width=15)
-search_entry.pack(side=tk.LEFT, padx=5)
-
-search_btn = tk.Button(button_frame, text="Search", command=lambda: search_employees(search_entry.get()))
-search_btn.pack(side=tk.LEFT, padx=5)
-
-cols = ("ID", "Name", "Grade", "Salary", "Y1", "Y2", "Y3", "Y4", "Y5", "Max Band", "Exceeded Year", "Flag")
-
-tree_frame = tk.Frame(root)
-tree_frame.grid(row=7, column=0, columnspan=10, pady=10, sticky="nsew")
-root.grid_rowconfigure(7, weight=1)
-root.grid_columnconfigure(0, weight=1)
-
-x_scroll = tk.Scrollbar(tree_frame, orient=tk.HORIZONTAL)
-x_scroll.pack(side=tk.BOTTOM, fill=tk.X)
-
-tree = ttk.Treeview(tree_frame, columns=cols, show='headings', xscrollcommand=x_scroll.set, selectmode="extended")
-x_scroll.config(command=tree.xview)
-
-for col in cols:
-    tree.heading(col, text=col)
-    tree.column(col, width=100, anchor='center')
-
-tree.pack(fill='both', expand=True)
+def show_performance_evaluation(parent=None):
+    """
+    Build the employee window: a Toplevel of parent, or the application's own
+    Tk root when run on its own. Returns the window. Every window keeps its
+    own widgets, so several can be open at once.
+    """
+    root = tk.Toplevel(parent) if parent else tk.Tk()
+    root.title("Employee Performance Database")
+    root.geometry("1000x650")          # Initial size
+    root.minsize(900, 600)             # Minimum size to ensure layout fits on smaller screens
+
+    form_frame = tk.Frame(root)
+    form_frame.grid(row=0, column=0, columnspan=10, sticky="w", padx=10, pady=5)
+
+    tk.Label(form_frame, text="Name").grid(row=0, column=0, sticky="w")
+    name_entry = tk.Entry(form_frame)
+    name_entry.grid(row=0, column=1, padx=5)
+
+    tk.Label(form_frame, text="Grade").grid(row=1, column=0, sticky="w")
+    grade_entry = tk.Entry(form_frame)
+    grade_entry.grid(row=1, column=1, padx=5)
+
+    tk.Label(form_frame, text="Current Salary").grid(row=2, column=0, sticky="w")
+    salary_entry = tk.Entry(form_frame)
+    salary_entry.grid(row=2, column=1, padx=5)
+
+    tk.Label(form_frame, text="Scores (Y1–Y5)").grid(row=3, column=0, sticky="w")
+
+    scores_frame = tk.Frame(form_frame)
+    scores_frame.grid(row=3, column=1, sticky="w", padx=(5, 0))  # << Add this padx
+
+    score_entries = [tk.Entry(scores_frame, width=4) for _ in range(5)]
+    for i, entry in enumerate(score_entries):
+        entry.grid(row=0, column=i, padx=4)
+
+    # Create a centered button frame
+    button_frame = tk.Frame(root)
+    button_frame.grid(row=4, column=0, columnspan=10, pady=10)
+
+    submit_btn = tk.Button(button_frame, text="Add Employee",
+                           command=lambda: submit_form(name_entry, grade_entry, salary_entry, score_entries))
+    submit_btn.pack(side=tk.LEFT, padx=10)
+
+    eval_btn = tk.Button(button_frame, text="Show Salary Projections", command=lambda: show_evaluations(root))
+    eval_btn.pack(side=tk.LEFT, padx=10)
+
+    budget_btn = tk.Button(button_frame, text="Show Combined Budget", command=lambda: show_salary_budget(root, tree))
+    budget_btn.pack(side=tk.LEFT, padx=10)
+
+    simulate_btn = tk.Button(button_frame, text="Simulate Budget", command=lambda: show_budget_simulation(root))
+    simulate_btn.pack(side=tk.LEFT, padx=10)
+
+    delete_btn = tk.Button(button_frame, text="Delete Selected", command=lambda: delete_selected_employee(tree))
+    delete_btn.pack(side=tk.LEFT, padx=10)
+
+    import_btn = tk.Button(button_frame, text="Import CSV", command=lambda: import_from_csv(root))
+    import_btn.pack(side=tk.LEFT, padx=10)
+
+    export_btn = tk.Button(button_frame, text="Export CSV", command=lambda: export_to_csv(root))
+    export_btn.pack(side=tk.LEFT, padx=10)
+
+    tk.Label(button_frame, text="Search Name:").pack(side=tk.LEFT, padx=5)
+    search_entry = tk.Entry(button_frame, width=15)
+    search_entry.pack(side=tk.LEFT, padx=5)
+
+    # Text the grid is filtered by, matches fetched so far, the search
+    # waiting for typing to pause and any full reload still running
+    search = {"text": "", "fetched": 0, "job": None, "loading": None}
+
+    def show_search(offset=0):
+        if search["loading"]:
+            search["loading"].cancel()  # Superseded; its rows must not overwrite this view
+            search["loading"] = None
+        if search["text"]:
+            more = search_employees(tree, search["text"], offset)
+        else:
+            search["loading"] = display_records(tree)
+            more = False
+        search["fetched"] = offset + SEARCH_PAGE_SIZE
+        more_btn.config(state=tk.NORMAL if more else tk.DISABLED)
+        search_status.config(text=f"Showing the first {len(tree):,} matches" if more else "")
+
+    def run_search(force=False):
+        search["job"] = None
+        if not search_entry.winfo_exists():
+            return
+        text = search_entry.get().strip()
+        if text == search["text"] and not force:
+            return  # Keys such as arrows and Shift do not change the query
+        search["text"] = text
+        show_search()
+
+    def schedule_search(event):
+        if search["job"]:
+            root.after_cancel(search["job"])
+        search["job"] = root.after(SEARCH_DELAY_MS, run_search)
+
+    def search_now():
+        if search["job"]:
+            root.after_cancel(search["job"])
+        run_search(force=True)
+
+    search_btn = tk.Button(button_frame, text="Search", command=search_now)
+    search_btn.pack(side=tk.LEFT, padx=5)
+    search_entry.bind("<KeyRelease>", schedule_search)
+
+    # Searches return SEARCH_PAGE_SIZE matches at a time
+    more_frame = tk.Frame(root)
+    more_frame.grid(row=5, column=0, columnspan=10, sticky="e", padx=10)
+    search_status = tk.Label(more_frame, text="")
+    search_status.pack(side=tk.LEFT, padx=5)
+    more_btn = tk.Button(more_frame, text="Load More", state=tk.DISABLED,
+                         command=lambda: show_search(search["fetched"]))
+    more_btn.pack(side=tk.LEFT, padx=5)
+
+    cols = ("ID", "Name", "Grade", "Salary", "Y1", "Y2", "Y3", "Y4", "Y5", "Max Band", "Exceeded Year", "Flag")
+
+    tree_frame = tk.Frame(root)
+    tree_frame.grid(row=7, column=0, columnspan=10, pady=10, sticky="nsew")
+    root.grid_rowconfigure(7, weight=1)
+    root.grid_columnconfigure(0, weight=1)
+
+    x_scroll = tk.Scrollbar(tree_frame, orient=tk.HORIZONTAL)
+    x_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+
+    tree = VirtualTreeview(tree_frame, cols, xscrollcommand=x_scroll.set, selectmode="extended")
+    x_scroll.config(command=tree.xview)
 
-display_records()
-root.mainloop()
\ No newline at end of file
+    for col in cols:
+        tree.heading(col, text=col)
+        tree.column(col, width=100, anchor='center')
+
+    tree.pack(fill='both', expand=True)
+
+    # Keep the grid in step with writes from this and other windows
+    def listener(action, ids):
+        if action == "reload":
+            show_search()
+        else:
+            on_employees_changed(tree, action, ids, search["text"])
+
+    add_listener(listener)
+    tree.bind("<Destroy>", lambda e: remove_listener(listener), add="+")
+    show_search()
+    return root
+
+if __name__ == "__main__":
+    create_database()
+    show_performance_evaluation().mainloop()
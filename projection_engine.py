@@ -0,0 +1,298 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Score to increase rate mapping shared by every projection
+score_increase = {1: 0.00, 2: 0.01, 3: 0.02, 4: 0.025, 5: 0.03}
+DEFAULT_INCREASE = 0.02  # Used for missing or unrecognised scores
+YEARS = 5
+CACHE_SIZE = 4           # Whole-table projections kept in the shared cache
+CACHE_MIN_ROWS = 10_000  # Smaller stores (single rows, search pages) are projected without the cache
+MAX_FORECAST_YEARS = 50  # Horizons covered by the precomputed growth table
+
+_rate_version = 0        # Bumped whenever score_increase changes
+_band_version = 0        # Bumped whenever the grade bands are reloaded
+
+
+def rate_table(increases=None):
+    """Array mapping a score code to its raise rate (code 0 = missing score)."""
+    increases = score_increase if increases is None else increases
+    table = np.full(max(increases) + 1, DEFAULT_INCREASE)
+    for score, pct in increases.items():
+        table[score] = pct
+    return table
+
+
+def score_codes(scores, increases=None):
+    """
+    Convert rows of Y1–Y5 scores into an integer code matrix.
+
+    Args:
+        scores: Sequence of score rows; entries may be None or out of range.
+
+    Returns:
+        np.ndarray: (employees, years) int array, 0 where the score is not in the mapping.
+    """
+    increases = score_increase if increases is None else increases
+    values = np.array(scores, dtype=float)
+    if values.ndim != 2:
+        values = values.reshape(len(scores), -1) if len(scores) else np.zeros((0, YEARS))
+    valid = np.isin(values, list(increases))
+    return np.where(valid, values, 0).astype(np.intp)
+
+
+def round_cents(values):
+    """
+    Vectorized equivalent of Python's ``round(value, 2)``.
+
+    ``np.round`` scales by 100 before rounding, so values whose scaled product
+    lands exactly on a half cent are resolved the wrong way. The rounding error
+    of the scaling is recovered exactly (Dekker product) to settle those ties
+    the way the built-in does.
+    """
+    values = np.asarray(values, dtype=float)
+    scaled = values * 100
+    split = values * 134217729.0
+    high = split - (split - values)
+    low = values - high
+    error = (high * 100 - scaled) + low * 100
+
+    cents = np.rint(scaled)
+    tie = (scaled - np.floor(scaled)) == 0.5
+    cents = np.where(tie & (error > 0), np.ceil(scaled), cents)
+    cents = np.where(tie & (error < 0), np.floor(scaled), cents)
+    return cents / 100
+
+
+def compound(salaries, rates):
+    """
+    Compound salaries year by year, rounding to cents after every raise.
+
+    Every year's rounding depends on the salary reached so far, so there is no
+    salary-independent cumulative factor per score prefix to tabulate here;
+    only the unrounded constant-score forecasts read one (growth_table).
+
+    Args:
+        salaries: (employees,) starting salaries.
+        rates: (employees, years) raise rate applied in each year.
+
+    Returns:
+        np.ndarray: (employees, years) salary at the end of each year.
+    """
+    salary = np.asarray(salaries, dtype=float)
+    rates = np.asarray(rates, dtype=float)
+    progression = np.empty(rates.shape)
+    for year in range(rates.shape[1]):
+        salary = round_cents(salary * (1 + rates[:, year]))
+        progression[:, year] = salary
+    return progression
+
+
+def first_exceed_year(progression, max_salaries):
+    """1-based year each salary first goes above its band maximum, 0 if never."""
+    exceeded = progression > np.asarray(max_salaries, dtype=float)[:, None]
+    return np.where(exceeded.any(axis=1), exceeded.argmax(axis=1) + 1, 0)
+
+
+def project_employees(salaries, max_salaries, scores, years=YEARS):
+    """
+    Project every employee's salary in one pass.
+
+    Args:
+        salaries: (employees,) current salaries.
+        max_salaries: (employees,) band maximum for each employee (NaN if unknown).
+        scores: (employees, years) performance scores, None where missing.
+
+    Returns:
+        tuple: (progression, exceeded_year, min_score_exceed_year) where the
+        exceed years are 0 when the band maximum is never passed. The last one
+        assumes a score of 3 in every year.
+    """
+    salaries = np.asarray(salaries, dtype=float)
+    rates = rate_table()[score_codes(scores)]
+    progression = compound(salaries, rates)
+    exceeded_year = first_exceed_year(progression, max_salaries)
+
+    baseline = np.full((len(salaries), years), score_increase[3])
+    min_score_exceed_year = first_exceed_year(compound(salaries, baseline), max_salaries)
+    return progression, exceeded_year, min_score_exceed_year
+
+
+# ------------------------------------------------------------------
+# Band crossing solver
+# ------------------------------------------------------------------
+def crossing_year_constant(salaries, max_salaries, rate, horizon=YEARS):
+    """
+    First year (1..horizon) in which ``salary * (1 + rate) ** year`` goes above
+    the band maximum, solved directly with logarithms instead of stepping year
+    by year. Salaries are not rounded between years.
+
+    Variable score sequences are not solved here: the windows report their
+    crossing year from the cent-rounded progression (first_exceed_year), which
+    no unrounded product can reproduce exactly.
+
+    Args:
+        rate: Yearly raise, either one value or one per employee.
+
+    Returns:
+        np.ndarray: Crossing year per employee, 0 if not within the horizon.
+    """
+    salaries = np.asarray(salaries, dtype=float)
+    max_salaries = np.asarray(max_salaries, dtype=float)
+    growth = 1 + np.broadcast_to(np.asarray(rate, dtype=float), salaries.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        years = np.floor(np.log(max_salaries / salaries) / np.log(growth)) + 1
+    years = np.where(salaries > max_salaries, 1, years)
+    years = np.clip(np.where(np.isnan(years), horizon + 1, years), 1, horizon + 1)
+
+    # The logarithms can land one year off right at the boundary
+    years = np.where((years > 1) & (salaries * growth ** (years - 1) > max_salaries), years - 1, years)
+    years = np.where((years <= horizon) & ~(salaries * growth ** years > max_salaries), years + 1, years)
+    return np.where(years <= horizon, years, 0).astype(int)
+
+
+# ------------------------------------------------------------------
+# Constant-score forecasts
+# ------------------------------------------------------------------
+_growth_tables = {}
+
+
+def growth_table(max_years=MAX_FORECAST_YEARS):
+    """
+    Cumulative growth factors ``(1 + rate) ** years`` for every score code and
+    every horizon from 0 to max_years, built once per raise table version.
+
+    Returns:
+        np.ndarray: (score codes, max_years + 1) table.
+    """
+    key = (_rate_version, max_years)
+    table = _growth_tables.get(key)
+    if table is None:
+        # Built with Python's ** (the table is tiny) so factors match the scalar formula bit for bit
+        table = np.array([[(1 + rate) ** years for years in range(max_years + 1)] for rate in rate_table().tolist()])
+        _growth_tables.clear()
+        _growth_tables[key] = table
+    return table
+
+
+def forecast_salaries(salaries, scores, years):
+    """
+    Unrounded salary of every employee after ``years`` and ``years - 1`` years
+    of receiving the same forecast score each year.
+
+    Returns:
+        tuple: (forecasted salaries, previous year's forecasted salaries)
+    """
+    salaries = np.asarray(salaries, dtype=float)
+    codes = score_codes([[score] for score in scores])[:, 0]
+    if years <= MAX_FORECAST_YEARS:
+        table = growth_table()
+        return salaries * table[codes, years], salaries * table[codes, years - 1]
+    rates = rate_table().tolist()
+    factors = np.array([(1 + rate) ** years for rate in rates])
+    previous = np.array([(1 + rate) ** (years - 1) for rate in rates])
+    return salaries * factors[codes], salaries * previous[codes]
+
+
+# ------------------------------------------------------------------
+# Shared projection cache
+# ------------------------------------------------------------------
+class ProjectionCache:
+    """
+    Thread-safe LRU of whole-table projections.
+
+    A key is a digest of the salary, band maximum and score arrays plus the
+    raise table and band versions, so any edited employee gives a new key and
+    a repeated reload of an unchanged table costs one hash instead of a
+    projection. Only a change to the raise table or the bands needs to clear it.
+    """
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*arrays):
+        digest = hashlib.blake2b(repr((_rate_version, _band_version)).encode(), digest_size=16)
+        for array in arrays:
+            array = np.ascontiguousarray(array)
+            digest.update(repr((array.dtype.str, array.shape)).encode())
+            digest.update(array.data)
+        return digest.digest()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+projection_cache = ProjectionCache()
+
+
+def set_score_increase(increases):
+    """Replace the raise mapping used by every projection and drop cached results."""
+    global _rate_version
+    score_increase.clear()
+    score_increase.update(increases)
+    _rate_version += 1
+    projection_cache.clear()
+
+
+def bands_changed():
+    """Called by the band registry after it (re)loads; stale projections are dropped."""
+    global _band_version
+    _band_version += 1
+    projection_cache.clear()
+
+
+def project_cached(salaries, max_salaries, scores):
+    """
+    project_employees for a whole table, served from projection_cache when
+    the same salaries, band maximums and scores were projected before.
+    Stores under CACHE_MIN_ROWS cost less to project than to hash and would
+    only push the full table out of the cache, so they bypass it.
+
+    Args:
+        salaries, max_salaries: (employees,) float arrays.
+        scores: (employees, years) score matrix (e.g. EmployeeStore.scores).
+
+    Returns:
+        tuple: Read-only (progression, exceeded_year, min_score_exceed_year) arrays.
+    """
+    salaries = np.asarray(salaries, dtype=float)
+    max_salaries = np.asarray(max_salaries, dtype=float)
+    scores = np.asarray(scores)
+    if len(salaries) < CACHE_MIN_ROWS:
+        return project_employees(salaries, max_salaries, scores)
+    key = projection_cache.key(salaries, max_salaries, scores)
+    result = projection_cache.get(key)
+    if result is None:
+        result = project_employees(salaries, max_salaries, scores)
+        for array in result:
+            array.setflags(write=False)
+        projection_cache.put(key, result)
+    return result
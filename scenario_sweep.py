@@ -0,0 +1,112 @@
+import hashlib
+import itertools
+import os
+import pathlib
+
+import numpy as np
+
+from grade_bands import bands
+from projection_engine import YEARS, first_exceed_year, rate_table, round_cents, score_codes, score_increase
+
+SWEEP_CACHE_DIR = pathlib.Path("sweep_cache")  # Memoized sweep results, one .npz per input set
+_CACHE_FORMAT = 1                              # Bump when the stored arrays change meaning
+
+
+def all_score_sequences(years=YEARS):
+    """
+    Every sequence of known scores over ``years`` years (5^5 = 3,125 for the
+    default five years), in lexicographic order.
+
+    Returns:
+        np.ndarray: (sequences, years) int array.
+    """
+    scores = sorted(score_increase)
+    sequences = np.array(list(itertools.product(scores, repeat=years)), dtype=np.intp)
+    return sequences.reshape(-1, years)
+
+
+def sweep_progressions(start_salaries, max_salaries, sequences):
+    """
+    Compound every starting salary under every score sequence, rounding to
+    cents each year like simulate_grade_progression. Scores outside the raise
+    table give no raise.
+
+    Args:
+        start_salaries: (grades,) starting salaries.
+        max_salaries: (grades,) band maximums.
+        sequences: (sequences, years) score sequences.
+
+    Returns:
+        tuple: ((sequences, grades, years) salaries, (sequences, grades) first
+        year above the band maximum, 0 if never)
+    """
+    start_salaries = np.asarray(start_salaries, dtype=float)
+    max_salaries = np.asarray(max_salaries, dtype=float)
+    table = rate_table()
+    table[0] = 0.0
+    growth = 1 + table[score_codes(sequences)]
+    count, years = growth.shape
+
+    progression = np.empty((count, len(start_salaries), years))
+    salary = np.broadcast_to(start_salaries, (count, len(start_salaries)))
+    for year in range(years):
+        salary = round_cents(salary * growth[:, year, None])
+        progression[:, :, year] = salary
+
+    exceeded = first_exceed_year(progression.reshape(-1, years), np.tile(max_salaries, count))
+    return progression, exceeded.reshape(count, len(start_salaries))
+
+
+def _cache_key(grades, start_salaries, max_salaries, sequences):
+    digest = hashlib.sha256()
+    digest.update(repr((_CACHE_FORMAT, list(grades), sorted(score_increase.items()))).encode())
+    for values in (start_salaries, max_salaries, sequences):
+        array = np.ascontiguousarray(values)
+        digest.update(repr((array.dtype.str, array.shape)).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def sweep_grades(sequences=None, years=YEARS, cache_dir=SWEEP_CACHE_DIR):
+    """
+    Evaluate many score sequences against every grade band at once, each
+    grade starting at its band midpoint.
+
+    Results are memoized on disk under a hash of the sequences, the bands and
+    the raise table, so repeating a sweep only reads the stored arrays. Any
+    change to the bands or raises gives a new key.
+
+    Args:
+        sequences: (sequences, years) scores; default is all_score_sequences(years).
+        cache_dir: Directory for the memo files, or None to always compute.
+
+    Returns:
+        dict: ``grades`` (tuple), ``sequences``, ``progression``
+        (sequences × grades × years) and ``exceeded_year`` (sequences ×
+        grades, 0 when the band maximum is never passed).
+    """
+    sequences = all_score_sequences(years) if sequences is None else np.asarray(sequences, dtype=np.intp)
+    if sequences.ndim != 2:
+        raise ValueError("Score sequences must be a 2-D (sequences, years) array.")
+    rows = bands.rows()
+    grades = tuple(row[0] for row in rows)
+    start_salaries = np.array([row[2] for row in rows], dtype=float)
+    max_salaries = np.array([row[3] for row in rows], dtype=float)
+
+    path = None
+    if cache_dir is not None:
+        path = pathlib.Path(cache_dir) / f"{_cache_key(grades, start_salaries, max_salaries, sequences)}.npz"
+        try:
+            with np.load(path) as stored:
+                return {"grades": grades, "sequences": sequences,
+                        "progression": stored["progression"], "exceeded_year": stored["exceeded_year"]}
+        except (OSError, KeyError, ValueError):
+            pass  # Not swept yet, or an unreadable file that gets rewritten below
+
+    progression, exceeded_year = sweep_progressions(start_salaries, max_salaries, sequences)
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(partial, progression=progression, exceeded_year=exceeded_year)
+        os.replace(partial, path)
+    return {"grades": grades, "sequences": sequences, "progression": progression, "exceeded_year": exceeded_year}
@@ -0,0 +1,118 @@
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+POLL_MS = 50      # How often the Tk thread checks for finished work
+MAX_WORKERS = 2
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="hr-worker")
+
+
+class Task:
+    """Handle for a background job: cancellation flag plus the latest progress report."""
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self.progress = None  # (done, total) as last reported by the worker
+        self.future = None
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def report_progress(self, done, total=None):
+        """Progress callback for worker code; raises CancelledError once the user cancels."""
+        if self.cancelled:
+            raise CancelledError()
+        self.progress = (done, total)
+
+
+class ProgressDialog:
+    """Small modal-looking window with a progress bar and a Cancel button."""
+
+    def __init__(self, parent, title, on_cancel):
+        self.window = tk.Toplevel(parent)
+        self.window.title(title)
+        self.window.geometry("320x110")
+        self.window.resizable(False, False)
+        self.window.transient(parent.winfo_toplevel())
+        self.window.protocol("WM_DELETE_WINDOW", on_cancel)
+
+        self.label = ttk.Label(self.window, text=title)
+        self.label.pack(pady=(12, 4))
+        self.bar = ttk.Progressbar(self.window, mode="indeterminate", length=260)
+        self.bar.pack(pady=4)
+        self.bar.start(10)
+        ttk.Button(self.window, text="Cancel", command=on_cancel).pack(pady=4)
+
+    def update_progress(self, progress):
+        if not progress or not progress[1]:
+            return
+        done, total = progress
+        if str(self.bar["mode"]) != "determinate":
+            self.bar.stop()
+            self.bar.configure(mode="determinate", maximum=total)
+        self.bar["value"] = done
+        self.label.configure(text=f"{done:,} of {total:,}")
+
+    def close(self):
+        if self.window.winfo_exists():
+            self.window.destroy()
+
+
+def run_in_background(parent, func, *args, on_done=None, on_error=None, title="Working…",
+                      show_progress=True, pass_progress=False, **kwargs):
+    """
+    Run func(*args, **kwargs) on a worker thread without blocking the Tk mainloop.
+
+    Args:
+        parent: Widget whose after() loop polls for the result.
+        on_done: Called on the Tk thread with func's return value.
+        on_error: Called on the Tk thread with the raised exception (defaults to an error box).
+        show_progress: Show a progress window with a Cancel button while func runs.
+        pass_progress: Pass ``progress=task.report_progress`` to func so it can report
+            (done, total) and stop early when cancelled.
+
+    Returns:
+        Task: Handle that can be used to cancel the job. Results of a cancelled
+        job are discarded.
+    """
+    task = Task()
+    if pass_progress:
+        kwargs["progress"] = task.report_progress
+    task.future = _executor.submit(func, *args, **kwargs)
+    dialog = ProgressDialog(parent, title, task.cancel) if show_progress else None
+
+    def poll():
+        if task.cancelled or not parent.winfo_exists():
+            task.cancel()
+            if dialog:
+                dialog.close()
+            return
+        if dialog:
+            dialog.update_progress(task.progress)
+        if not task.future.done():
+            parent.after(POLL_MS, poll)
+            return
+
+        if dialog:
+            dialog.close()
+        try:
+            result = task.future.result()
+        except CancelledError:
+            return
+        except Exception as e:
+            if on_error:
+                on_error(e)
+            else:
+                messagebox.showerror("Error", str(e), parent=parent)
+            return
+        if on_done:
+            on_done(result)
+
+    parent.after(POLL_MS, poll)
+    return task
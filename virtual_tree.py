@@ -0,0 +1,230 @@
+import tkinter as tk
+from tkinter import ttk
+
+DEFAULT_ROW_HEIGHT = 20   # ttk's default Treeview row height in pixels
+HEADING_HEIGHT = 25       # Approximate height of the column headings
+SCROLL_UNITS = 3          # Rows moved per mouse wheel notch
+
+
+class VirtualTreeview(ttk.Frame):
+    """
+    Treeview that keeps every row in a plain Python model and only creates Tk
+    items for the rows on screen (plus a small buffer).
+
+    Rows are tuples whose ``key_column`` value identifies the employee; the Tk
+    item id of a rendered row is ``str(key)``, or the row's position when
+    ``key_column`` is None. The commonly used Treeview methods (selection,
+    item, heading, column, tag_configure, bind, xview) are forwarded so the
+    windows can use it like a regular ``ttk.Treeview``. A bound
+    ``<<RowsScrolled>>`` handler runs whenever the first visible row changes.
+    """
+
+    def __init__(self, parent, columns, height=20, buffer=5, key_column=0, **tree_options):
+        super().__init__(parent)
+        tree_options.setdefault("show", "headings")
+        self.tree = ttk.Treeview(self, columns=columns, height=height, **tree_options)
+        self.vsb = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.key_column = key_column
+        self.buffer = buffer
+        self._rows = []            # Row value tuples in display order
+        self._tags = []            # Tag name (or None) for each row
+        self._positions = {}       # str(key) -> index into _rows
+        self._selected = set()     # Selected str(key)s, including rows scrolled off screen
+        self._rendered_selection = set()
+        self._extend_selection = False
+        self._offset = 0
+        self._visible = height
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<ButtonPress-1>", self._on_click, add="+")
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-SCROLL_UNITS))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(SCROLL_UNITS))
+        for key, step in (("<Up>", -1), ("<Down>", 1), ("<Prior>", "-page"), ("<Next>", "page")):
+            self.tree.bind(key, lambda e, step=step: self._on_key(step))
+
+    # --------------------------------------------------------------
+    # Model
+    # --------------------------------------------------------------
+    def set_rows(self, rows, tags=None):
+        """Replace the whole dataset; selection is kept for keys that still exist."""
+        self._rows = [tuple(row) for row in rows]
+        self._tags = list(tags) if tags is not None else [None] * len(self._rows)
+        self._positions = {self._iid(i): i for i in range(len(self._rows))}
+        self._selected &= self._positions.keys()
+        self._render()
+
+    def upsert_row(self, row, tag=None):
+        """Replace the row with the same key in place, or append it if it is new."""
+        self.upsert_rows([row], [tag])
+
+    def upsert_rows(self, rows, tags=None):
+        """upsert_row for many rows, redrawing the visible window once."""
+        rows = [tuple(row) for row in rows]
+        for row, tag in zip(rows, tags if tags is not None else [None] * len(rows)):
+            iid = str(row[self.key_column]) if self.key_column is not None else str(len(self._rows))
+            index = self._positions.get(iid)
+            if index is None:
+                self._positions[iid] = len(self._rows)
+                self._rows.append(row)
+                self._tags.append(tag)
+            else:
+                self._rows[index] = row
+                self._tags[index] = tag
+        self._render()
+
+    def remove_rows(self, iids):
+        """Drop the given item ids from the model and redraw the visible window."""
+        doomed = {str(iid) for iid in iids} & self._positions.keys()
+        if not doomed:
+            return
+        kept = [i for i in range(len(self._rows)) if self._iid(i) not in doomed]
+        self._rows = [self._rows[i] for i in kept]
+        self._tags = [self._tags[i] for i in kept]
+        self._positions = {self._iid(i): i for i in range(len(self._rows))}
+        self._selected -= doomed
+        self._render()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def _iid(self, index):
+        if self.key_column is None:
+            return str(index)
+        return str(self._rows[index][self.key_column])
+
+    def row(self, iid):
+        """Values of the row with the given item id, whether rendered or not."""
+        return self._rows[self._positions[str(iid)]]
+
+    # --------------------------------------------------------------
+    # Treeview compatible API
+    # --------------------------------------------------------------
+    def selection(self):
+        return tuple(sorted(self._selected, key=self._positions.__getitem__))
+
+    def item(self, iid, option=None):
+        index = self._positions[str(iid)]
+        tag = self._tags[index]
+        info = {"values": list(self._rows[index]), "tags": [tag] if tag else []}
+        return info[option] if option else info
+
+    def get_children(self, item=""):
+        return tuple(self._iid(i) for i in range(len(self._rows)))
+
+    def heading(self, column, **options):
+        return self.tree.heading(column, **options)
+
+    def column(self, column, **options):
+        return self.tree.column(column, **options)
+
+    def tag_configure(self, tagname, **options):
+        return self.tree.tag_configure(tagname, **options)
+
+    def bind(self, sequence=None, func=None, add=None):
+        return self.tree.bind(sequence, func, add)
+
+    def xview(self, *args):
+        return self.tree.xview(*args)
+
+    # --------------------------------------------------------------
+    # Scrolling
+    # --------------------------------------------------------------
+    def scroll(self, rows):
+        self.scroll_to(self._offset + rows)
+
+    @property
+    def offset(self):
+        """Index of the first row on screen."""
+        return self._offset
+
+    def scroll_to(self, offset):
+        offset = max(0, min(offset, len(self._rows) - self._visible))
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
+            self.tree.event_generate("<<RowsScrolled>>")
+
+    def see(self, iid):
+        index = self._positions[str(iid)]
+        if index < self._offset:
+            self.scroll_to(index)
+        elif index >= self._offset + self._visible:
+            self.scroll_to(index - self._visible + 1)
+
+    def _render(self):
+        self._offset = max(0, min(self._offset, len(self._rows) - self._visible))
+        window = range(self._offset, min(len(self._rows), self._offset + self._visible + self.buffer))
+
+        self.tree.delete(*self.tree.get_children())
+        rendered = [self._iid(index) for index in window]
+        for index, iid in zip(window, rendered):
+            tag = self._tags[index]
+            self.tree.insert("", tk.END, iid=iid, values=self._rows[index], tags=(tag,) if tag else ())
+
+        self._rendered_selection = self._selected.intersection(rendered)
+        self.tree.selection_set(list(self._rendered_selection))
+        self.tree.yview_moveto(0)
+
+        total = len(self._rows)
+        if total:
+            self.vsb.set(self._offset / total, min(1.0, (self._offset + self._visible) / total))
+        else:
+            self.vsb.set(0.0, 1.0)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == tk.MOVETO:
+            self.scroll_to(int(float(value) * len(self._rows)))
+        elif action == tk.SCROLL:
+            step = self._visible if unit == tk.PAGES else 1
+            self.scroll(int(value) * step)
+
+    def _on_mousewheel(self, event):
+        self.scroll(-SCROLL_UNITS if event.delta > 0 else SCROLL_UNITS)
+        return "break"
+
+    def _on_resize(self, event):
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or DEFAULT_ROW_HEIGHT)
+        visible = max(1, (event.height - HEADING_HEIGHT) // row_height)
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    # --------------------------------------------------------------
+    # Selection
+    # --------------------------------------------------------------
+    def _on_click(self, event):
+        # Shift or Control extends the selection instead of replacing it
+        self._extend_selection = bool(event.state & 0x0005)
+
+    def _on_select(self, event):
+        current = set(self.tree.selection())
+        if current == self._rendered_selection:
+            return  # Selection restored by _render, not a user change
+        if self._extend_selection:
+            rendered = set(self.tree.get_children())
+            self._selected = (self._selected - rendered) | current
+        else:
+            self._selected = current
+        self._rendered_selection = current
+
+    def _on_key(self, step):
+        if not self._rows:
+            return "break"
+        focus = self.tree.focus()
+        index = self._positions.get(focus, self._offset)
+        if step in ("page", "-page"):
+            step = self._visible if step == "page" else -self._visible
+        index = max(0, min(len(self._rows) - 1, index + step))
+        iid = self._iid(index)
+
+        self._selected = {iid}
+        self._extend_selection = False
+        self.see(iid)
+        self._render()
+        self.tree.focus(iid)
+        return "break"